@@ -2,14 +2,41 @@
 """
 Comprehensive BioPro Repository Analysis Script
 Extracts ALL events, services, and relationships from 4 BioPro repositories
+
+The module is valid Cython source as-is; for faster extraction compile it in
+place and run the compiled module (the .py stays as the pure-Python fallback):
+    cythonize -3 -i analyze_biopro_comprehensive.py
+    python -c "import analyze_biopro_comprehensive as a; a.main()"
+Python imports the compiled module in preference to the .py, so rerun cythonize
+after editing this file, or delete the build to run the source again:
+    rm -f analyze_biopro_comprehensive.*.so analyze_biopro_comprehensive.c
+A build older than the .py prints a warning on import.
 """
 
 import os
 import re
+import sys
 import json
+import pickle
 from pathlib import Path
-from typing import Dict, List, Set, Any
-from collections import defaultdict
+from typing import Dict, List, Optional, Set, Tuple, Any
+from collections import defaultdict, deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from itertools import islice
+
+try:
+    import hyperscan  # Optional: single-pass multi-pattern prescan of sources
+except ImportError:
+    hyperscan = None
+
+def _check_compiled_build():
+    """Warn when running a compiled build that is older than its .py source"""
+    module = Path(__file__)
+    source = module.with_name(module.name.split('.')[0] + '.py')
+    if module != source and source.exists() and source.stat().st_mtime > module.stat().st_mtime:
+        print(f"Warning: {module.name} is older than {source.name}; rerun cythonize or delete the build")
+
+_check_compiled_build()
 
 # Repository configurations
 REPOSITORIES = {
@@ -32,6 +59,101 @@ REPOSITORIES = {
     }
 }
 
+# Known service purposes, keyed by service name
+SERVICE_PURPOSES = {
+    "collections": "Manages blood collection interfaces and donation processing",
+    "customer": "Manages customer information and relationships",
+    "eventbridge": "Bridges events between distribution services",
+    "inventory": "Manages blood product inventory",
+    "irradiation": "Manages blood product irradiation processing",
+    "order": "Manages blood product orders",
+    "partnerorderprovider": "Provides partner order integration",
+    "receiving": "Manages receiving of blood products",
+    "recoveredplasmashipping": "Manages recovered plasma shipping",
+    "shipping": "Manages blood product shipping",
+    "eventmanagement": "Manages donor events and incidents",
+    "history": "Manages donor history",
+    "notification": "Manages notifications",
+    "testresultmanagement": "Manages test results",
+    "device": "Manages medical devices",
+    "research": "Manages research operations",
+    "role": "Manages user roles and permissions",
+    "supply": "Manages medical supplies"
+}
+
+# Per-file extraction cache; bump the version whenever extraction output changes
+CACHE_FILE = Path(__file__).with_name(".biopro_analysis_cache.pkl")
+_CACHE_VERSION = 2
+
+# Precompiled Java source patterns. Sources are scanned as raw bytes since every
+# token of interest is ASCII; only the small captured groups get decoded.
+_CLASS_RE = re.compile(rb'public\s+class\s+(\w+)')
+_FIELD_RE = re.compile(rb'(?:private|protected|public)\s+(\w+(?:<[\w\s,<>]+>)?)\s+(\w+);')
+_KAFKA_LISTENER_RE = re.compile(rb'@KafkaListener\s*\(\s*topics\s*=\s*["\']([^"\']+)["\']')
+_KAFKA_TEMPLATE_RE = re.compile(rb'kafkaTemplate\.send\s*\(\s*["\']([^"\']+)["\']')
+_TOPIC_PROP_RE = re.compile(rb'topics\s*=\s*"\$\{([^}]+)\}"')
+_LISTENER_EVENT_RE = re.compile(rb'public\s+void\s+\w+\s*\([^)]*?(\w+Event)[^)]*\)')
+_PRODUCER_EVENT_RE = re.compile(rb'kafkaTemplate\.send\s*\([^,]*,\s*(\w+Event)')
+
+# Threads used to prefetch source files within a service analysis, and how many
+# reads may be queued ahead of the file being processed
+_READ_WORKERS = 16
+_READ_AHEAD = 4 * _READ_WORKERS
+
+# Literal every listener/producer match must contain; checked before any regex
+_EVENT_TOKEN = b'Event'
+
+# Path components that mark test sources
+_TEST_DIRS = {'test', 'tests'}
+
+# Directories never worth descending into when looking for source files
+_SKIP_DIRS = {'test', 'tests', 'target', 'build', '.git', 'node_modules'}
+
+_SCAN_PATTERNS = [_CLASS_RE, _FIELD_RE, _KAFKA_LISTENER_RE, _KAFKA_TEMPLATE_RE,
+                  _TOPIC_PROP_RE, _LISTENER_EVENT_RE, _PRODUCER_EVENT_RE]
+
+def _compile_scan_database():
+    """Compile all source patterns into one Hyperscan database, if available"""
+    if hyperscan is None:
+        return None
+    try:
+        db = hyperscan.Database()
+        db.compile(expressions=[p.pattern for p in _SCAN_PATTERNS],
+                   ids=list(range(len(_SCAN_PATTERNS))),
+                   flags=[hyperscan.HS_FLAG_SINGLEMATCH] * len(_SCAN_PATTERNS))
+        return db
+    except hyperscan.error as e:
+        print(f"Warning: Hyperscan unavailable, falling back to re: {e}")
+        return None
+
+_SCAN_DB = _compile_scan_database()
+
+def _text(token: bytes) -> str:
+    """Decode a captured source token"""
+    return token.decode('utf-8', 'ignore')
+
+def _read_source(filepath: str) -> bytes:
+    """Read a source file's raw bytes"""
+    with open(filepath, 'rb') as f:
+        return f.read()
+
+def _iter_java_files(root: str):
+    """Yield (path, (mtime_ns, size)) for .java files under root, pruning test/build directories"""
+    stack = [root]
+    while stack:
+        directory = stack.pop()
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name not in _SKIP_DIRS:
+                            stack.append(entry.path)
+                    elif entry.name.endswith('.java') and entry.is_file(follow_symlinks=False):
+                        st = entry.stat(follow_symlinks=False)
+                        yield entry.path, (st.st_mtime_ns, st.st_size)
+        except OSError as e:
+            print(f"    Warning: Could not scan {directory}: {e}")
+
 class JavaEventExtractor:
     """Extracts event information from Java files"""
 
@@ -39,48 +161,63 @@ class JavaEventExtractor:
         self.events = []
         self.listeners = []
         self.producers = []
+        self._hits = None
+
+    def prescan(self, content: bytes):
+        """Record which patterns occur in content using one Hyperscan pass"""
+        if _SCAN_DB is None:
+            self._hits = None
+            return
+
+        hits = set()
+
+        def on_match(pattern_id, start, end, flags, context):
+            hits.add(_SCAN_PATTERNS[pattern_id])
 
-    def extract_class_name(self, content: str, filepath: str) -> str:
+        _SCAN_DB.scan(content, match_event_handler=on_match)
+        self._hits = hits
+
+    def might_match(self, pattern) -> bool:
+        """True unless the prescan proved pattern absent from the current file"""
+        return self._hits is None or pattern in self._hits
+
+    def extract_class_name(self, content: bytes, filepath: str) -> str:
         """Extract class name from Java file"""
-        match = re.search(r'public\s+class\s+(\w+)', content)
+        match = self.might_match(_CLASS_RE) and _CLASS_RE.search(content)
         if match:
-            return match.group(1)
-        return Path(filepath).stem
+            return sys.intern(_text(match.group(1)))
+        return sys.intern(Path(filepath).stem)
 
-    def extract_fields(self, content: str) -> List[Dict]:
+    def extract_fields(self, content: bytes) -> List[Dict]:
         """Extract field definitions from Java class"""
-        fields = []
+        if not self.might_match(_FIELD_RE):
+            return []
+
         # Match private/protected/public fields
-        field_pattern = r'(?:private|protected|public)\s+(\w+(?:<[\w\s,<>]+>)?)\s+(\w+);'
-        for match in re.finditer(field_pattern, content):
-            field_type = match.group(1)
-            field_name = match.group(2)
-            fields.append({
-                "name": field_name,
-                "type": field_type
-            })
-        return fields
-
-    def extract_kafka_topic(self, content: str) -> str:
+        # Names and types repeat heavily across events, so share one copy of each
+        return [{"name": sys.intern(_text(field_name)), "type": sys.intern(_text(field_type))}
+                for field_type, field_name in _FIELD_RE.findall(content)]
+
+    def extract_kafka_topic(self, content: bytes) -> str:
         """Extract Kafka topic from producer/listener"""
         # Look for @KafkaListener(topics = ...)
-        match = re.search(r'@KafkaListener\s*\(\s*topics\s*=\s*["\']([^"\']+)["\']', content)
+        match = self.might_match(_KAFKA_LISTENER_RE) and _KAFKA_LISTENER_RE.search(content)
         if match:
-            return match.group(1)
+            return _text(match.group(1))
 
         # Look for KafkaTemplate.send(topic, ...)
-        match = re.search(r'kafkaTemplate\.send\s*\(\s*["\']([^"\']+)["\']', content)
+        match = self.might_match(_KAFKA_TEMPLATE_RE) and _KAFKA_TEMPLATE_RE.search(content)
         if match:
-            return match.group(1)
+            return _text(match.group(1))
 
         # Look for topic property references
-        match = re.search(r'topics\s*=\s*"\$\{([^}]+)\}"', content)
+        match = self.might_match(_TOPIC_PROP_RE) and _TOPIC_PROP_RE.search(content)
         if match:
-            return match.group(1)
+            return _text(match.group(1))
 
         return None
 
-    def extract_event_type(self, content: str, class_name: str) -> str:
+    def extract_event_type(self, content: bytes, class_name: str) -> str:
         """Determine event type from class content"""
         if 'Event' not in class_name:
             return "unknown"
@@ -107,81 +244,126 @@ class JavaEventExtractor:
         else:
             return "DOMAIN_EVENT"
 
-    def is_event_file(self, filepath: str) -> bool:
-        """Check if file is an event definition"""
-        filename = Path(filepath).name
+    def classify(self, filepath: str) -> Optional[str]:
+        """Classify a Java file as 'event', 'listener', 'producer' or None"""
+        # Split on both separators so Windows test directories are excluded too
+        parts = filepath.replace('\\', '/').split('/')
+        filename = parts[-1]
+        if not filename.endswith('.java') or not _TEST_DIRS.isdisjoint(parts):
+            return None
+
         # Event files typically have 'Event' in the name
-        if 'Event' in filename and filename.endswith('.java'):
-            # Exclude test files
-            if 'Test' not in filename and '/test/' not in filepath:
-                # Exclude abstract/base event classes (we want concrete events)
-                if not any(x in filename for x in ['AbstractEvent', 'DomainEvent', 'EventMessage']):
-                    return True
-        return False
-
-    def is_listener_file(self, filepath: str) -> bool:
-        """Check if file is an event listener/consumer"""
-        filename = Path(filepath).name
-        return 'Listener' in filename and filename.endswith('.java') and '/test/' not in filepath
-
-    def is_producer_file(self, filepath: str) -> bool:
-        """Check if file is an event producer/publisher"""
-        filename = Path(filepath).name
-        return ('Producer' in filename or 'Publisher' in filename) and filename.endswith('.java') and '/test/' not in filepath
+        if 'Event' in filename and 'Test' not in filename:
+            # Exclude abstract/base event classes (we want concrete events)
+            if not any(x in filename for x in ('AbstractEvent', 'DomainEvent', 'EventMessage')):
+                return 'event'
+
+        if 'Listener' in filename:
+            return 'listener'
+        if 'Producer' in filename or 'Publisher' in filename:
+            return 'producer'
+        return None
 
 class ServiceAnalyzer:
     """Analyzes a single microservice"""
 
-    def __init__(self, repo_name: str, service_name: str, service_path: str):
+    def __init__(self, repo_name: str, service_name: str, service_path: str,
+                 file_cache: Optional[Dict] = None):
         self.repo_name = repo_name
         self.service_name = service_name
         self.service_path = service_path
         self.extractor = JavaEventExtractor()
 
-        self.published_events = []
-        self.consumed_events = []
+        # filepath -> ((mtime_ns, size), record) from a previous run
+        self.file_cache = file_cache or {}
+        self.file_results = {}
+
+        self.published_events = set()
+        self.consumed_events = set()
         self.event_details = []
 
     def analyze(self) -> Dict:
         """Analyze the service"""
         print(f"  Analyzing {self.service_name}...")
 
-        # Find all Java files
-        java_files = list(Path(self.service_path).rglob("*.java"))
-
-        # Process event files
-        for jfile in java_files:
-            try:
-                content = jfile.read_text(encoding='utf-8', errors='ignore')
-                filepath = str(jfile)
-
-                if self.extractor.is_event_file(filepath):
-                    self._process_event_file(filepath, content)
-                elif self.extractor.is_listener_file(filepath):
-                    self._process_listener_file(filepath, content)
-                elif self.extractor.is_producer_file(filepath):
-                    self._process_producer_file(filepath, content)
-            except Exception as e:
-                print(f"    Warning: Could not process {jfile}: {e}")
+        # Find and classify all Java files
+        java_files = []
+        for filepath, stamp in _iter_java_files(self.service_path):
+            kind = self.extractor.classify(filepath)
+            if kind is not None:
+                java_files.append((filepath, stamp, kind))
+
+        # Files not in the cache, or changed since it was written, are re-read
+        stale = set()
+        for filepath, stamp, kind in java_files:
+            cached = self.file_cache.get(filepath)
+            if cached is None or cached[0] != stamp:
+                stale.add(filepath)
+
+        with ThreadPoolExecutor(max_workers=_READ_WORKERS) as readers:
+            # Prefetch sources of files not in the cache; reads release the GIL.
+            # At most _READ_AHEAD reads are in flight and each future is dropped
+            # once used, so only a window of file contents is held at a time
+            to_read = (filepath for filepath, stamp, kind in java_files if filepath in stale)
+            reads = deque(readers.submit(_read_source, filepath)
+                          for filepath in islice(to_read, _READ_AHEAD))
+
+            # Process event files
+            for filepath, stamp, kind in java_files:
+                if filepath not in stale:
+                    record = self.file_cache[filepath][1]
+                else:
+                    read = reads.popleft()
+                    for next_path in islice(to_read, 1):
+                        reads.append(readers.submit(_read_source, next_path))
+                    try:
+                        content = read.result()
+
+                        if kind != 'event' and _EVENT_TOKEN not in content:
+                            # Listener/producer patterns only ever capture *Event names
+                            record = {"event": None, "publishes": set(), "consumes": set()}
+                        else:
+                            self.extractor.prescan(content)
+                            if kind == 'event':
+                                record = self._process_event_file(filepath, content)
+                            elif kind == 'listener':
+                                record = self._process_listener_file(filepath, content)
+                            else:
+                                record = self._process_producer_file(filepath, content)
+                    except Exception as e:
+                        print(f"    Warning: Could not process {filepath}: {e}")
+                        continue
+
+                self.file_results[filepath] = (stamp, record)
+                self._add_record(record)
 
         return self._build_service_info()
 
-    def _process_event_file(self, filepath: str, content: str):
+    def _add_record(self, record: Dict):
+        """Merge one file's extraction record into the service totals"""
+        if record['event'] is not None:
+            self.event_details.append(record['event'])
+        self.published_events.update(record['publishes'])
+        self.consumed_events.update(record['consumes'])
+
+    def _process_event_file(self, filepath: str, content: bytes) -> Dict:
         """Process an event definition file"""
+        record = {"event": None, "publishes": set(), "consumes": set()}
         class_name = self.extractor.extract_class_name(content, filepath)
 
         # Only process actual event classes (not DTOs or mappers)
         if not class_name.endswith('Event'):
-            return
+            return record
 
         event_type = self.extractor.extract_event_type(content, class_name)
         fields = self.extractor.extract_fields(content)
 
         # Determine if this is published or consumed by checking file location
-        is_outbound = 'output' in filepath or 'producer' in filepath.lower() or 'outbound' in filepath.lower()
-        is_inbound = 'input' in filepath or 'listener' in filepath.lower() or 'consumer' in filepath.lower() or 'inbound' in filepath.lower()
+        lower_path = filepath.lower()
+        is_outbound = 'output' in filepath or 'producer' in lower_path or 'outbound' in lower_path
+        is_inbound = 'input' in filepath or 'listener' in lower_path or 'consumer' in lower_path or 'inbound' in lower_path
 
-        event_info = {
+        record["event"] = {
             "name": class_name,
             "type": event_type,
             "version": "1.0",  # Default, would need to parse actual version if available
@@ -190,38 +372,37 @@ class ServiceAnalyzer:
             "direction": "outbound" if is_outbound else ("inbound" if is_inbound else "unknown")
         }
 
-        self.event_details.append(event_info)
-
         if is_outbound:
-            self.published_events.append(class_name)
+            record["publishes"].add(class_name)
         elif is_inbound:
-            self.consumed_events.append(class_name)
+            record["consumes"].add(class_name)
+        return record
 
-    def _process_listener_file(self, filepath: str, content: str):
+    def _process_listener_file(self, filepath: str, content: bytes) -> Dict:
         """Process an event listener file"""
+        record = {"event": None, "publishes": set(), "consumes": set()}
         class_name = self.extractor.extract_class_name(content, filepath)
         topic = self.extractor.extract_kafka_topic(content)
 
         # Extract consumed event names from the listener
         # Look for event type in method parameters
-        event_pattern = r'public\s+void\s+\w+\s*\([^)]*?(\w+Event)[^)]*\)'
-        for match in re.finditer(event_pattern, content):
-            event_name = match.group(1)
-            if event_name not in self.consumed_events:
-                self.consumed_events.append(event_name)
+        if not self.extractor.might_match(_LISTENER_EVENT_RE):
+            return record
+        record["consumes"].update(sys.intern(_text(name)) for name in _LISTENER_EVENT_RE.findall(content))
+        return record
 
-    def _process_producer_file(self, filepath: str, content: str):
+    def _process_producer_file(self, filepath: str, content: bytes) -> Dict:
         """Process an event producer file"""
+        record = {"event": None, "publishes": set(), "consumes": set()}
         class_name = self.extractor.extract_class_name(content, filepath)
         topic = self.extractor.extract_kafka_topic(content)
 
         # Extract produced event names
         # Look for kafkaTemplate.send or event publishing patterns
-        event_pattern = r'kafkaTemplate\.send\s*\([^,]*,\s*(\w+Event)'
-        for match in re.finditer(event_pattern, content):
-            event_name = match.group(1)
-            if event_name not in self.published_events:
-                self.published_events.append(event_name)
+        if not self.extractor.might_match(_PRODUCER_EVENT_RE):
+            return record
+        record["publishes"].update(sys.intern(_text(name)) for name in _PRODUCER_EVENT_RE.findall(content))
+        return record
 
     def _build_service_info(self) -> Dict:
         """Build service information dictionary"""
@@ -229,34 +410,43 @@ class ServiceAnalyzer:
             "name": self.service_name,
             "repository": self.repo_name,
             "purpose": self._infer_purpose(),
-            "publishes": sorted(list(set(self.published_events))),
-            "consumes": sorted(list(set(self.consumed_events))),
+            "publishes": sorted(self.published_events),
+            "consumes": sorted(self.consumed_events),
             "events": self.event_details
         }
 
     def _infer_purpose(self) -> str:
         """Infer service purpose from name"""
-        purposes = {
-            "collections": "Manages blood collection interfaces and donation processing",
-            "customer": "Manages customer information and relationships",
-            "eventbridge": "Bridges events between distribution services",
-            "inventory": "Manages blood product inventory",
-            "irradiation": "Manages blood product irradiation processing",
-            "order": "Manages blood product orders",
-            "partnerorderprovider": "Provides partner order integration",
-            "receiving": "Manages receiving of blood products",
-            "recoveredplasmashipping": "Manages recovered plasma shipping",
-            "shipping": "Manages blood product shipping",
-            "eventmanagement": "Manages donor events and incidents",
-            "history": "Manages donor history",
-            "notification": "Manages notifications",
-            "testresultmanagement": "Manages test results",
-            "device": "Manages medical devices",
-            "research": "Manages research operations",
-            "role": "Manages user roles and permissions",
-            "supply": "Manages medical supplies"
-        }
-        return purposes.get(self.service_name, f"Manages {self.service_name} operations")
+        return SERVICE_PURPOSES.get(self.service_name, f"Manages {self.service_name} operations")
+
+def _analyze_service(task: Tuple[str, str, str], file_cache: Optional[Dict] = None) -> Tuple[Dict, Dict]:
+    """Analyze one (repo, service, path) task; module-level so it can be pickled.
+
+    Returns the service info and the per-file results used to refresh the cache.
+    """
+    repo_name, service_name, service_path = task
+    analyzer = ServiceAnalyzer(repo_name, service_name, service_path, file_cache)
+    return analyzer.analyze(), analyzer.file_results
+
+def load_analysis_cache() -> Dict:
+    """Load per-file extraction results from the previous run"""
+    try:
+        with open(CACHE_FILE, 'rb') as f:
+            cache = pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError):
+        return {}
+    if cache.get("version") != _CACHE_VERSION:
+        return {}
+    return cache["services"]
+
+def save_analysis_cache(services: Dict):
+    """Persist per-file extraction results, keyed by (repo, service)"""
+    try:
+        with open(CACHE_FILE, 'wb') as f:
+            pickle.dump({"version": _CACHE_VERSION, "services": services}, f,
+                        protocol=pickle.HIGHEST_PROTOCOL)
+    except OSError as e:
+        print(f"Warning: Could not write analysis cache {CACHE_FILE}: {e}")
 
 class RepositoryAnalyzer:
     """Analyzes a complete repository"""
@@ -264,29 +454,40 @@ class RepositoryAnalyzer:
     def __init__(self, repo_name: str, repo_config: Dict):
         self.repo_name = repo_name
         self.repo_config = repo_config
+        self.repo_path = Path(repo_config['path'])
         self.services = []
 
-    def analyze(self) -> Dict:
-        """Analyze the entire repository"""
-        print(f"\nAnalyzing repository: {self.repo_name}")
+    def find_services(self) -> List[Tuple[str, str, str]]:
+        """Locate service directories as (repo, service, path) analysis tasks"""
+        print(f"\nScanning repository: {self.repo_name}")
 
-        repo_path = Path(self.repo_config['path'])
-        if not repo_path.exists():
-            print(f"  Warning: Repository path does not exist: {repo_path}")
-            return {"name": self.repo_name, "services": []}
+        if not self.repo_path.exists():
+            print(f"  Warning: Repository path does not exist: {self.repo_path}")
+            return []
 
+        tasks = []
         for service_name in self.repo_config['services']:
-            service_path = repo_path / "backend" / service_name
+            service_path = self.repo_path / "backend" / service_name
             if service_path.exists():
-                analyzer = ServiceAnalyzer(self.repo_name, service_name, str(service_path))
-                service_info = analyzer.analyze()
-                self.services.append(service_info)
+                tasks.append((self.repo_name, service_name, str(service_path)))
             else:
                 print(f"  Warning: Service path not found: {service_path}")
+        return tasks
+
+    def analyze(self) -> Dict:
+        """Analyze the entire repository"""
+        services = [_analyze_service(task)[0] for task in self.find_services()]
+        return self.build_repo_info(services)
+
+    def build_repo_info(self, services: List[Dict]) -> Dict:
+        """Build repository information dictionary from analyzed services"""
+        self.services = services
+        if not self.repo_path.exists():
+            return {"name": self.repo_name, "services": []}
 
         return {
             "name": self.repo_name,
-            "path": str(repo_path),
+            "path": str(self.repo_path),
             "services": self.services
         }
 
@@ -296,38 +497,43 @@ class EventFlowMapper:
     def __init__(self, repositories: List[Dict]):
         self.repositories = repositories
         self.event_flows = []
+        self.orphaned_count = 0
 
     def map_flows(self) -> List[Dict]:
         """Map all event flows"""
         print("\nMapping event flows...")
 
         # Build event name to service mapping
-        event_publishers = defaultdict(list)
-        event_consumers = defaultdict(list)
+        event_publishers = defaultdict(set)
+        event_consumers = defaultdict(set)
 
         for repo in self.repositories:
             for service in repo['services']:
                 service_id = f"{repo['name']}/{service['name']}"
 
                 for event_name in service['publishes']:
-                    event_publishers[event_name].append(service_id)
+                    event_publishers[event_name].add(service_id)
 
                 for event_name in service['consumes']:
-                    event_consumers[event_name].append(service_id)
+                    event_consumers[event_name].add(service_id)
 
         # Create flow mappings
-        all_events = set(event_publishers.keys()) | set(event_consumers.keys())
+        all_events = sorted(event_publishers.keys() | event_consumers.keys())
+        self.event_flows = [None] * len(all_events)
+        self.orphaned_count = 0
 
-        for event_name in sorted(all_events):
-            publishers = event_publishers.get(event_name, [])
-            consumers = event_consumers.get(event_name, [])
+        for index, event_name in enumerate(all_events):
+            publishers = sorted(event_publishers.get(event_name, ()))
+            consumers = sorted(event_consumers.get(event_name, ()))
+            is_orphaned = not publishers or not consumers
+            self.orphaned_count += is_orphaned
 
-            self.event_flows.append({
+            self.event_flows[index] = {
                 "event": event_name,
                 "publishers": publishers,
                 "consumers": consumers,
-                "is_orphaned": len(publishers) == 0 or len(consumers) == 0
-            })
+                "is_orphaned": is_orphaned
+            }
 
         return self.event_flows
 
@@ -336,12 +542,27 @@ def main():
     print("BioPro Comprehensive Repository Analysis")
     print("=" * 80)
 
-    # Analyze all repositories
-    all_repositories = []
-    for repo_name, repo_config in REPOSITORIES.items():
-        analyzer = RepositoryAnalyzer(repo_name, repo_config)
-        repo_info = analyzer.analyze()
-        all_repositories.append(repo_info)
+    # Collect service tasks from all repositories
+    analyzers = [RepositoryAnalyzer(name, config) for name, config in REPOSITORIES.items()]
+    tasks = [task for analyzer in analyzers for task in analyzer.find_services()]
+
+    # Services are independent, so analyze them in parallel worker processes.
+    # Files unchanged since the last run are served from the on-disk cache.
+    cache = load_analysis_cache()
+    print(f"\nAnalyzing {len(tasks)} services...")
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as pool:
+        results = list(pool.map(_analyze_service, tasks,
+                                [cache.get(task[:2]) for task in tasks]))
+
+    # Regroup results by repository, preserving configured service order
+    services_by_repo = defaultdict(list)
+    new_cache = {}
+    for task, (service_info, file_results) in zip(tasks, results):
+        services_by_repo[task[0]].append(service_info)
+        new_cache[task[:2]] = file_results
+    save_analysis_cache(new_cache)
+    all_repositories = [analyzer.build_repo_info(services_by_repo[analyzer.repo_name])
+                        for analyzer in analyzers]
 
     # Map event flows
     flow_mapper = EventFlowMapper(all_repositories)
@@ -354,9 +575,9 @@ def main():
         "event_flows": event_flows,
         "summary": {
             "total_repositories": len(all_repositories),
-            "total_services": sum(len(r['services']) for r in all_repositories),
+            "total_services": len(results),  # one service info per analyzed task
             "total_events": len(event_flows),
-            "orphaned_events": len([f for f in event_flows if f['is_orphaned']])
+            "orphaned_events": flow_mapper.orphaned_count
         }
     }
 
@@ -390,90 +611,91 @@ def generate_markdown_report(inventory: Dict):
     """Generate human-readable markdown report"""
     md_file = "C:/Users/MelvinJones/work/event-governance/poc/BIOPRO-COMPLETE-ANALYSIS.md"
 
-    with open(md_file, 'w', encoding='utf-8') as f:
-        f.write("# BioPro Complete Repository Analysis\n\n")
-        f.write(f"**Analysis Date:** {inventory['analysis_date']}\n\n")
-        f.write("## Executive Summary\n\n")
-        f.write(f"- **Repositories Analyzed:** {inventory['summary']['total_repositories']}\n")
-        f.write(f"- **Services Discovered:** {inventory['summary']['total_services']}\n")
-        f.write(f"- **Events Discovered:** {inventory['summary']['total_events']}\n")
-        f.write(f"- **Orphaned Events:** {inventory['summary']['orphaned_events']}\n\n")
-
-        f.write("## Repository Overview\n\n")
-        for repo in inventory['repositories']:
-            f.write(f"### {repo['name']}\n\n")
-            f.write(f"**Path:** `{repo.get('path', 'N/A')}`\n\n")
-            f.write(f"**Services:** {len(repo['services'])}\n\n")
-
-            for service in repo['services']:
-                f.write(f"#### {service['name']}\n\n")
-                f.write(f"**Purpose:** {service['purpose']}\n\n")
-                f.write(f"**Publishes:** {len(service['publishes'])} events\n\n")
-                if service['publishes']:
-                    for event in service['publishes']:
-                        f.write(f"- {event}\n")
-                    f.write("\n")
-
-                f.write(f"**Consumes:** {len(service['consumes'])} events\n\n")
-                if service['consumes']:
-                    for event in service['consumes']:
-                        f.write(f"- {event}\n")
-                    f.write("\n")
-
-                if service['events']:
-                    f.write(f"**Event Details:**\n\n")
-                    for event in service['events']:
-                        f.write(f"##### {event['name']}\n\n")
-                        f.write(f"- **Type:** {event['type']}\n")
-                        f.write(f"- **Version:** {event['version']}\n")
-                        f.write(f"- **Direction:** {event['direction']}\n")
-                        if event['fields']:
-                            f.write(f"- **Fields:** {len(event['fields'])}\n")
-                            for field in event['fields'][:10]:  # Limit to first 10 fields
-                                f.write(f"  - `{field['name']}`: {field['type']}\n")
-                            if len(event['fields']) > 10:
-                                f.write(f"  - ... and {len(event['fields']) - 10} more fields\n")
-                        f.write("\n")
-                f.write("\n")
-
-        f.write("## Event Flows\n\n")
-        f.write("This section maps all event flows between services.\n\n")
-
-        for flow in inventory['event_flows']:
-            f.write(f"### {flow['event']}\n\n")
-
-            if flow['publishers']:
-                f.write(f"**Publishers:**\n\n")
-                for pub in flow['publishers']:
-                    f.write(f"- {pub}\n")
-                f.write("\n")
-            else:
-                f.write(f"**Publishers:** NONE ⚠️\n\n")
+    # Accumulate the report and write it in one go
+    parts = []
+    write = parts.append
+    extend = parts.extend
+    write("# BioPro Complete Repository Analysis\n\n")
+    write(f"**Analysis Date:** {inventory['analysis_date']}\n\n")
+    write("## Executive Summary\n\n")
+    write(f"- **Repositories Analyzed:** {inventory['summary']['total_repositories']}\n")
+    write(f"- **Services Discovered:** {inventory['summary']['total_services']}\n")
+    write(f"- **Events Discovered:** {inventory['summary']['total_events']}\n")
+    write(f"- **Orphaned Events:** {inventory['summary']['orphaned_events']}\n\n")
+
+    write("## Repository Overview\n\n")
+    for repo in inventory['repositories']:
+        write(f"### {repo['name']}\n\n")
+        write(f"**Path:** `{repo.get('path', 'N/A')}`\n\n")
+        write(f"**Services:** {len(repo['services'])}\n\n")
+
+        for service in repo['services']:
+            write(f"#### {service['name']}\n\n")
+            write(f"**Purpose:** {service['purpose']}\n\n")
+            write(f"**Publishes:** {len(service['publishes'])} events\n\n")
+            if service['publishes']:
+                extend([f"- {event}\n" for event in service['publishes']])
+                write("\n")
+
+            write(f"**Consumes:** {len(service['consumes'])} events\n\n")
+            if service['consumes']:
+                extend([f"- {event}\n" for event in service['consumes']])
+                write("\n")
+
+            if service['events']:
+                write(f"**Event Details:**\n\n")
+                for event in service['events']:
+                    write(f"##### {event['name']}\n\n")
+                    write(f"- **Type:** {event['type']}\n")
+                    write(f"- **Version:** {event['version']}\n")
+                    write(f"- **Direction:** {event['direction']}\n")
+                    if event['fields']:
+                        write(f"- **Fields:** {len(event['fields'])}\n")
+                        # Limit to first 10 fields
+                        extend([f"  - `{field['name']}`: {field['type']}\n" for field in event['fields'][:10]])
+                        if len(event['fields']) > 10:
+                            write(f"  - ... and {len(event['fields']) - 10} more fields\n")
+                    write("\n")
+            write("\n")
+
+    write("## Event Flows\n\n")
+    write("This section maps all event flows between services.\n\n")
+
+    for flow in inventory['event_flows']:
+        write(f"### {flow['event']}\n\n")
+
+        if flow['publishers']:
+            write(f"**Publishers:**\n\n")
+            extend([f"- {pub}\n" for pub in flow['publishers']])
+            write("\n")
+        else:
+            write(f"**Publishers:** NONE ⚠️\n\n")
 
-            if flow['consumers']:
-                f.write(f"**Consumers:**\n\n")
-                for con in flow['consumers']:
-                    f.write(f"- {con}\n")
-                f.write("\n")
-            else:
-                f.write(f"**Consumers:** NONE ⚠️\n\n")
-
-            if flow['is_orphaned']:
-                f.write("⚠️ **WARNING: This is an orphaned event (missing publisher or consumer)**\n\n")
-
-        f.write("## Orphaned Events Report\n\n")
-        orphaned = [f for f in inventory['event_flows'] if f['is_orphaned']]
-        if orphaned:
-            f.write(f"Found {len(orphaned)} orphaned events that need attention:\n\n")
-            for flow in orphaned:
-                f.write(f"### {flow['event']}\n\n")
-                pub = ', '.join(flow['publishers']) if flow['publishers'] else 'NONE'
-                con = ', '.join(flow['consumers']) if flow['consumers'] else 'NONE'
-                f.write(f"- Publishers: {pub}\n")
-                f.write(f"- Consumers: {con}\n\n")
+        if flow['consumers']:
+            write(f"**Consumers:**\n\n")
+            extend([f"- {con}\n" for con in flow['consumers']])
+            write("\n")
         else:
-            f.write("No orphaned events found. All events have both publishers and consumers.\n\n")
+            write(f"**Consumers:** NONE ⚠️\n\n")
+
+        if flow['is_orphaned']:
+            write("⚠️ **WARNING: This is an orphaned event (missing publisher or consumer)**\n\n")
+
+    write("## Orphaned Events Report\n\n")
+    orphaned = [f for f in inventory['event_flows'] if f['is_orphaned']]
+    if orphaned:
+        write(f"Found {len(orphaned)} orphaned events that need attention:\n\n")
+        for flow in orphaned:
+            write(f"### {flow['event']}\n\n")
+            pub = ', '.join(flow['publishers']) if flow['publishers'] else 'NONE'
+            con = ', '.join(flow['consumers']) if flow['consumers'] else 'NONE'
+            write(f"- Publishers: {pub}\n")
+            write(f"- Consumers: {con}\n\n")
+    else:
+        write("No orphaned events found. All events have both publishers and consumers.\n\n")
 
+    with open(md_file, 'w', encoding='utf-8') as f:
+        f.write(''.join(parts))
     print(f"Markdown report saved to: {md_file}")
 
 if __name__ == "__main__":
@@ -10,6 +10,85 @@ from reportlab.lib.enums import TA_LEFT, TA_CENTER
 from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle, PageBreak
 from reportlab.lib import colors
 
+# Markdown line patterns
+_HEADING_RE = re.compile(r'^(#{1,3})\s+(.*)')
+_NUM_LIST_RE = re.compile(r'^(\d+)\.\s*')
+_BOLD_RE = re.compile(r'\*\*(.+?)\*\*')
+_CODE_RE = re.compile(r'`([^`]+)`')
+
+def _md_bold(text):
+    """Convert **bold** spans to reportlab markup"""
+    return _BOLD_RE.sub(r'<b>\1</b>', text)
+
+def _md_inline(text, code_font='<font name="Courier">'):
+    """Convert **bold** and `code` spans to reportlab markup"""
+    return _CODE_RE.sub(code_font + r'\1</font>', _md_bold(text))
+
+# Styles (built once at import and shared by every conversion)
+_STYLES = getSampleStyleSheet()
+
+# Custom styles
+TITLE_STYLE = ParagraphStyle(
+    'CustomTitle',
+    parent=_STYLES['Heading1'],
+    fontSize=24,
+    textColor=colors.HexColor('#2c3e50'),
+    spaceAfter=12,
+    alignment=TA_LEFT
+)
+
+H1_STYLE = ParagraphStyle(
+    'CustomH1',
+    parent=_STYLES['Heading1'],
+    fontSize=18,
+    textColor=colors.HexColor('#2c3e50'),
+    spaceAfter=10,
+    spaceBefore=20
+)
+
+H2_STYLE = ParagraphStyle(
+    'CustomH2',
+    parent=_STYLES['Heading2'],
+    fontSize=14,
+    textColor=colors.HexColor('#34495e'),
+    spaceAfter=8,
+    spaceBefore=15
+)
+
+H3_STYLE = ParagraphStyle(
+    'CustomH3',
+    parent=_STYLES['Heading3'],
+    fontSize=12,
+    textColor=colors.HexColor('#7f8c8d'),
+    spaceAfter=6,
+    spaceBefore=10
+)
+
+BODY_STYLE = ParagraphStyle(
+    'CustomBody',
+    parent=_STYLES['Normal'],
+    fontSize=10,
+    leading=14
+)
+
+CODE_STYLE = ParagraphStyle(
+    'CustomCode',
+    parent=_STYLES['Code'],
+    fontSize=9,
+    fontName='Courier',
+    backgroundColor=colors.HexColor('#f4f4f4'),
+    leftIndent=10,
+    rightIndent=10
+)
+
+BULLET_STYLE = ParagraphStyle(
+    'CustomBullet',
+    parent=_STYLES['Normal'],
+    fontSize=10,
+    leftIndent=20,
+    bulletIndent=10
+)
+
 def markdown_to_pdf(md_file, pdf_file):
     """Convert markdown to PDF"""
 
@@ -27,71 +106,6 @@ def markdown_to_pdf(md_file, pdf_file):
         bottomMargin=0.75*inch
     )
 
-    # Styles
-    styles = getSampleStyleSheet()
-
-    # Custom styles
-    title_style = ParagraphStyle(
-        'CustomTitle',
-        parent=styles['Heading1'],
-        fontSize=24,
-        textColor=colors.HexColor('#2c3e50'),
-        spaceAfter=12,
-        alignment=TA_LEFT
-    )
-
-    h1_style = ParagraphStyle(
-        'CustomH1',
-        parent=styles['Heading1'],
-        fontSize=18,
-        textColor=colors.HexColor('#2c3e50'),
-        spaceAfter=10,
-        spaceBefore=20
-    )
-
-    h2_style = ParagraphStyle(
-        'CustomH2',
-        parent=styles['Heading2'],
-        fontSize=14,
-        textColor=colors.HexColor('#34495e'),
-        spaceAfter=8,
-        spaceBefore=15
-    )
-
-    h3_style = ParagraphStyle(
-        'CustomH3',
-        parent=styles['Heading3'],
-        fontSize=12,
-        textColor=colors.HexColor('#7f8c8d'),
-        spaceAfter=6,
-        spaceBefore=10
-    )
-
-    body_style = ParagraphStyle(
-        'CustomBody',
-        parent=styles['Normal'],
-        fontSize=10,
-        leading=14
-    )
-
-    code_style = ParagraphStyle(
-        'CustomCode',
-        parent=styles['Code'],
-        fontSize=9,
-        fontName='Courier',
-        backgroundColor=colors.HexColor('#f4f4f4'),
-        leftIndent=10,
-        rightIndent=10
-    )
-
-    bullet_style = ParagraphStyle(
-        'CustomBullet',
-        parent=styles['Normal'],
-        fontSize=10,
-        leftIndent=20,
-        bulletIndent=10
-    )
-
     # Build story
     story = []
 
@@ -107,30 +121,31 @@ def markdown_to_pdf(md_file, pdf_file):
             i += 1
             continue
 
-        # Title (first H1)
-        if line.startswith('# ') and i < 5:
-            story.append(Paragraph(line[2:], title_style))
-            story.append(Spacer(1, 0.2*inch))
+        heading = _HEADING_RE.match(line)
 
-        # H1
-        elif line.startswith('# '):
-            story.append(PageBreak())
-            story.append(Paragraph(line[2:], h1_style))
-            story.append(Spacer(1, 0.1*inch))
-
-        # H2
-        elif line.startswith('## '):
-            story.append(Paragraph(line[3:], h2_style))
-            story.append(Spacer(1, 0.08*inch))
+        # Headings (H1-H3)
+        if heading:
+            level = len(heading.group(1))
+            heading_text = heading.group(2)
 
-        # H3
-        elif line.startswith('### '):
-            story.append(Paragraph(line[4:], h3_style))
-            story.append(Spacer(1, 0.06*inch))
+            # Title (first H1)
+            if level == 1 and i < 5:
+                story.append(Paragraph(heading_text, TITLE_STYLE))
+                story.append(Spacer(1, 0.2*inch))
+            elif level == 1:
+                story.append(PageBreak())
+                story.append(Paragraph(heading_text, H1_STYLE))
+                story.append(Spacer(1, 0.1*inch))
+            elif level == 2:
+                story.append(Paragraph(heading_text, H2_STYLE))
+                story.append(Spacer(1, 0.08*inch))
+            else:
+                story.append(Paragraph(heading_text, H3_STYLE))
+                story.append(Spacer(1, 0.06*inch))
 
         # Bold metadata
         elif line.startswith('**') and '**:' in line:
-            story.append(Paragraph(line.replace('**', '<b>').replace('**', '</b>'), body_style))
+            story.append(Paragraph(_md_bold(line), BODY_STYLE))
             story.append(Spacer(1, 0.05*inch))
 
         # Table
@@ -193,26 +208,20 @@ def markdown_to_pdf(md_file, pdf_file):
                 code_text = '\n'.join(code_lines)
                 # Escape special characters
                 code_text = code_text.replace('<', '&lt;').replace('>', '&gt;')
-                story.append(Paragraph(f'<font name="Courier" size="8">{code_text}</font>', code_style))
+                story.append(Paragraph(f'<font name="Courier" size="8">{code_text}</font>', CODE_STYLE))
                 story.append(Spacer(1, 0.1*inch))
 
         # Bullet lists
-        elif line.startswith('- ') or line.startswith('* '):
-            bullet_text = line[2:]
+        elif line.startswith(('- ', '* ')):
             # Convert markdown formatting
-            bullet_text = bullet_text.replace('**', '<b>').replace('**', '</b>')
-            bullet_text = bullet_text.replace('`', '<font name="Courier">')
-            bullet_text = bullet_text.replace('`', '</font>')
-            story.append(Paragraph(f'• {bullet_text}', bullet_style))
+            bullet_text = _md_inline(line[2:])
+            story.append(Paragraph(f'• {bullet_text}', BULLET_STYLE))
             story.append(Spacer(1, 0.03*inch))
 
         # Numbered lists
-        elif re.match(r'^\d+\.', line):
-            list_text = re.sub(r'^\d+\.\s*', '', line)
-            list_text = list_text.replace('**', '<b>').replace('**', '</b>')
-            list_text = list_text.replace('`', '<font name="Courier">')
-            list_text = list_text.replace('`', '</font>')
-            story.append(Paragraph(list_text, bullet_style))
+        elif _NUM_LIST_RE.match(line):
+            list_text = _md_inline(_NUM_LIST_RE.sub('', line, count=1))
+            story.append(Paragraph(list_text, BULLET_STYLE))
             story.append(Spacer(1, 0.03*inch))
 
         # Horizontal rule
@@ -222,10 +231,8 @@ def markdown_to_pdf(md_file, pdf_file):
         # Regular paragraph
         else:
             # Convert markdown formatting
-            para_text = line.replace('**', '<b>').replace('**', '</b>')
-            para_text = para_text.replace('`', '<font name="Courier" size="9">')
-            para_text = para_text.replace('`', '</font>')
-            story.append(Paragraph(para_text, body_style))
+            para_text = _md_inline(line, code_font='<font name="Courier" size="9">')
+            story.append(Paragraph(para_text, BODY_STYLE))
             story.append(Spacer(1, 0.08*inch))
 
         i += 1
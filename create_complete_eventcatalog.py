@@ -11,12 +11,53 @@ This script:
 6. Creates service definition pages for ALL services
 """
 
+import asyncio
+import hashlib
 import json
 import os
 import re
-import requests
+import string
+import sys
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Dict, List, Any
+from functools import lru_cache
+from typing import Dict, List, Any, Tuple
+
+try:
+    import httpx
+except ImportError:
+    print("ERROR: httpx library not installed")
+    print("Install with: pip install 'httpx[http2]'")
+    sys.exit(1)
+
+try:
+    import h2  # noqa: F401 - enables HTTP/2 in httpx
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+try:
+    import orjson  # Optional: faster JSON for inventories, caches and schemas
+
+    def _dumps(obj: Any, sort_keys: bool = False) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_SORT_KEYS if sort_keys else None)
+
+    def _dumps_indent(obj: Any) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+
+    _loads = orjson.loads
+except ImportError:
+    # Compact, unescaped output matches orjson's, so fingerprints and cached
+    # signatures agree whichever serializer produced them
+    def _dumps(obj: Any, sort_keys: bool = False) -> bytes:
+        return json.dumps(obj, ensure_ascii=False, separators=(',', ':'),
+                          sort_keys=sort_keys).encode('utf-8')
+
+    def _dumps_indent(obj: Any) -> str:
+        return json.dumps(obj, indent=2)
+
+    _loads = json.loads
 
 # Configuration
 SCHEMA_REGISTRY_URL = "http://localhost:8081"
@@ -24,9 +65,20 @@ EVENTCATALOG_EVENTS_DIR = "eventcatalog/events"
 EVENTCATALOG_SERVICES_DIR = "eventcatalog/services"
 COMPLETE_INVENTORY_FILE = "biopro-complete-inventory-with-consumers.json"
 MANUFACTURING_INVENTORY_FILE = "biopro-events-inventory.json"
-
-# Service domain mapping - maps service names to their domain context
-SERVICE_DOMAINS = {
+PAGE_CACHE_FILE = ".eventcatalog_cache.json"
+SCHEMA_ID_CACHE_FILE = ".schema_id_cache.json"
+# Bump whenever page rendering changes in a way the page templates don't show
+# (create_eventcatalog_mdx, java_type_to_avro_type, ...)
+_PAGE_CACHE_VERSION = 1
+REGISTRY_CONCURRENCY = 32
+REGISTRY_RETRIES = 3
+RETRY_STATUSES = (502, 503, 504)
+REGISTRY_HEADERS = {"Content-Type": "application/vnd.schemaregistry.v1+json"}
+WRITE_CONCURRENCY = 16
+
+# Service domain mapping - maps service names to their domain context;
+# unknown services fall into the General domain
+SERVICE_DOMAINS = defaultdict(lambda: 'General', {
     # Manufacturing services
     "apheresisplasma": "Manufacturing",
     "apheresisplatelet": "Manufacturing",
@@ -67,24 +119,38 @@ SERVICE_DOMAINS = {
     "research": "Operations",
     "role": "Operations",
     "supply": "Operations"
+})
+
+# Java to Avro type mapping for simple types
+JAVA_TO_AVRO_TYPES = {
+    "String": "string",
+    "Integer": "int",
+    "Long": "long",
+    "Double": "double",
+    "Float": "float",
+    "Boolean": "boolean",
+    "ZonedDateTime": {"type": "long", "logicalType": "timestamp-millis"},
+    "Instant": {"type": "long", "logicalType": "timestamp-millis"},
+    "LocalDateTime": {"type": "long", "logicalType": "timestamp-millis"},
+    "LocalDate": {"type": "int", "logicalType": "date"},
+    "UUID": {"type": "string", "logicalType": "uuid"},
+}
+
+# Defaults given to optional fields of these primitive Avro types
+AVRO_DEFAULTS = {
+    "string": "",
+    "int": 0,
+    "long": 0,
+    "boolean": False,
 }
 
+
+@lru_cache(maxsize=None)
 def java_type_to_avro_type(java_type: str) -> Dict[str, Any]:
-    """Convert Java type to Avro type"""
-    type_mapping = {
-        "String": "string",
-        "Integer": "int",
-        "Long": "long",
-        "Double": "double",
-        "Float": "float",
-        "Boolean": "boolean",
-        "ZonedDateTime": {"type": "long", "logicalType": "timestamp-millis"},
-        "Instant": {"type": "long", "logicalType": "timestamp-millis"},
-        "LocalDateTime": {"type": "long", "logicalType": "timestamp-millis"},
-        "LocalDate": {"type": "int", "logicalType": "date"},
-        "UUID": {"type": "string", "logicalType": "uuid"},
-    }
+    """Convert Java type to Avro type
 
+    Results are memoized and shared between schemas, so treat them as read-only.
+    """
     # Handle List types
     if java_type.startswith("List<"):
         inner_type = java_type[5:-1]
@@ -99,35 +165,46 @@ def java_type_to_avro_type(java_type: str) -> Dict[str, Any]:
         return ["null", java_type_to_avro_type(inner_type)]
 
     # Handle complex types (aggregate classes)
-    if java_type not in type_mapping:
+    if java_type not in JAVA_TO_AVRO_TYPES:
         return "string"  # Default to string for complex types
 
-    return type_mapping.get(java_type, "string")
-
-
-def create_avro_schema_from_complete_event(event: Dict[str, Any]) -> Dict[str, Any]:
-    """Create Avro schema from complete inventory event"""
+    return JAVA_TO_AVRO_TYPES[java_type]
+
+
+# Standard fields shared by every event schema; the dicts are reused across
+# schemas, so treat them as read-only
+STANDARD_FIELDS = (
+    {
+        "name": "eventId",
+        "type": {"type": "string", "logicalType": "uuid"},
+        "doc": "Unique identifier for this event"
+    },
+    {
+        "name": "occurredOn",
+        "type": {"type": "long", "logicalType": "timestamp-millis"},
+        "doc": "Timestamp when event occurred"
+    },
+    {
+        "name": "occurredOnTimeZone",
+        "type": "string",
+        "doc": "Timezone for occurredOn",
+        "default": "UTC"
+    },
+)
+
+
+def create_avro_schema_from_complete_event(event: Dict[str, Any]) -> Tuple[Dict[str, Any], str]:
+    """Create Avro schema from complete inventory event
+
+    Returns the schema together with the event-specific rows of the MDX field
+    table, both built in the same pass over the event's fields.
+    """
     service = event.get('service', 'unknown')
     namespace = event.get('package', f"com.arcone.biopro.{service}.domain.event")
 
-    # Build standard fields
+    # Build standard fields; only eventType and eventVersion vary per event
     fields = [
-        {
-            "name": "eventId",
-            "type": {"type": "string", "logicalType": "uuid"},
-            "doc": "Unique identifier for this event"
-        },
-        {
-            "name": "occurredOn",
-            "type": {"type": "long", "logicalType": "timestamp-millis"},
-            "doc": "Timestamp when event occurred"
-        },
-        {
-            "name": "occurredOnTimeZone",
-            "type": "string",
-            "doc": "Timezone for occurredOn",
-            "default": "UTC"
-        },
+        *STANDARD_FIELDS,
         {
             "name": "eventType",
             "type": "string",
@@ -143,8 +220,12 @@ def create_avro_schema_from_complete_event(event: Dict[str, Any]) -> Dict[str, A
     ]
 
     # Add event-specific fields
+    field_rows = []
     for field in event.get('fields', []):
         field_type = java_type_to_avro_type(field['type'])
+        required = field.get('required', False)
+        field_rows.append(f"| {field['name']} | {field['type']} | {'Yes' if required else 'No'} "
+                          f"| {field.get('description', '')} |")
 
         field_def = {
             "name": field['name'],
@@ -153,13 +234,8 @@ def create_avro_schema_from_complete_event(event: Dict[str, Any]) -> Dict[str, A
         }
 
         # Add default for optional fields
-        if not field.get('required', False) and not isinstance(field_type, list):
-            if field_type == "string":
-                field_def["default"] = ""
-            elif field_type == "int" or field_type == "long":
-                field_def["default"] = 0
-            elif field_type == "boolean":
-                field_def["default"] = False
+        if not required and isinstance(field_type, str) and field_type in AVRO_DEFAULTS:
+            field_def["default"] = AVRO_DEFAULTS[field_type]
 
         fields.append(field_def)
 
@@ -171,39 +247,194 @@ def create_avro_schema_from_complete_event(event: Dict[str, Any]) -> Dict[str, A
         "fields": fields
     }
 
-    return schema
-
-
-def register_schema(subject: str, schema: Dict[str, Any]) -> int:
+    return schema, "\n".join(field_rows)
+
+
+def schema_fingerprint(schema: Dict[str, Any]) -> str:
+    """Hash the canonical JSON form of a schema"""
+    canonical = _dumps(schema, sort_keys=True)
+    return hashlib.blake2b(canonical, digest_size=16).hexdigest()
+
+
+def create_registry_client() -> httpx.AsyncClient:
+    """Create the shared keep-alive (and, when h2 is installed, HTTP/2) Schema Registry client"""
+    limits = httpx.Limits(max_keepalive_connections=REGISTRY_CONCURRENCY,
+                          max_connections=REGISTRY_CONCURRENCY)
+    transport = httpx.AsyncHTTPTransport(http2=HTTP2_AVAILABLE, limits=limits,
+                                         retries=REGISTRY_RETRIES)
+    return httpx.AsyncClient(base_url=SCHEMA_REGISTRY_URL, transport=transport, timeout=10,
+                             headers=REGISTRY_HEADERS)
+
+
+async def registry_request(client: httpx.AsyncClient, method: str, url: str, limit: asyncio.Semaphore,
+                           **kwargs) -> httpx.Response:
+    """Send a registry request, retrying gateway/unavailable responses with exponential backoff"""
+    # Registration is idempotent, so every method is safe to retry; the limit is held
+    # per attempt, never across a backoff sleep
+    for attempt in range(REGISTRY_RETRIES):
+        async with limit:
+            response = await client.request(method, url, **kwargs)
+        if response.status_code not in RETRY_STATUSES:
+            return response
+        await asyncio.sleep(0.5 * 2 ** attempt)
+    async with limit:
+        return await client.request(method, url, **kwargs)
+
+
+async def load_registry_cache(client: httpx.AsyncClient, subjects: List[str],
+                              limit: asyncio.Semaphore) -> Dict[str, Tuple[int, str]]:
+    """Fetch the latest (schema ID, fingerprint) of each given subject already in the registry"""
+    if not subjects:
+        return {}
+    try:
+        response = await registry_request(client, "GET", "/subjects", limit)
+        response.raise_for_status()
+        existing = set(response.json()).intersection(subjects)
+    except (httpx.HTTPError, ValueError) as e:
+        print(f"    [WARNING] Could not list registry subjects: {e}")
+        return {}
+
+    async def fetch_latest(subject: str):
+        try:
+            latest = await registry_request(client, "GET", f"/subjects/{subject}/versions/latest", limit)
+            latest.raise_for_status()
+            data = latest.json()
+            return subject, (data['id'], schema_fingerprint(_loads(data['schema'])))
+        except (httpx.HTTPError, ValueError, KeyError):
+            return subject, None
+
+    entries = await asyncio.gather(*[fetch_latest(subject) for subject in existing])
+    return {subject: entry for subject, entry in entries if entry}
+
+
+async def register_schema(client: httpx.AsyncClient, subject: str, schema: Dict[str, Any],
+                          limit: asyncio.Semaphore, registry_cache: Dict[str, Tuple[int, str]] = None) -> int:
     """Register schema in Schema Registry"""
-    url = f"{SCHEMA_REGISTRY_URL}/subjects/{subject}/versions"
-    headers = {"Content-Type": "application/vnd.schemaregistry.v1+json"}
-    payload = {"schema": json.dumps(schema)}
+    # Unchanged schemas are answered from the registry cache without any HTTP call
+    cached = registry_cache.get(subject) if registry_cache else None
+    if cached is not None and cached[1] == schema_fingerprint(schema):
+        return cached[0]
+
+    # normalize=true lets the registry match semantically identical schemas to their existing ID
+    url = f"/subjects/{subject}/versions?normalize=true"
+    body = _dumps({"schema": _dumps(schema).decode()})
 
     try:
-        response = requests.post(url, json=payload, headers=headers)
+        response = await registry_request(client, "POST", url, limit, content=body)
         if response.status_code == 409:
-            # Schema already exists - get the existing ID
-            get_url = f"{SCHEMA_REGISTRY_URL}/subjects/{subject}/versions/latest"
-            get_response = requests.get(get_url)
+            # Schema already exists - newer registries report the existing ID in the
+            # error body, older ones need a lookup of the latest version
+            try:
+                existing_id = response.json().get('id')
+            except ValueError:
+                existing_id = None
+            if existing_id is not None:
+                return existing_id
+            get_response = await registry_request(client, "GET", f"/subjects/{subject}/versions/latest",
+                                                  limit)
             if get_response.status_code == 200:
                 return get_response.json().get('id', -1)
         response.raise_for_status()
         result = response.json()
         return result.get('id', -1)
-    except requests.exceptions.RequestException as e:
+    except (httpx.HTTPError, ValueError) as e:
         print(f"       [WARNING] Error registering schema for {subject}: {e}")
         return -1
 
 
-def create_dlq_listener_code(event_name: str, service_name: str) -> str:
-    """Generate DLQ-aware Spring Boot listener code"""
-    topic_name = event_name.replace('Event', '').lower()
+async def register_schemas(registrations: List[Tuple[str, Dict[str, Any]]],
+                           schema_id_cache: Dict[str, int]) -> List[int]:
+    """Register (subject, schema) pairs concurrently over one client, returning IDs in input order
+
+    schema_id_cache maps "subject:fingerprint" to the ID from an earlier run; hits
+    need no HTTP call and new successful registrations are added to it.
+    """
+    limit = asyncio.Semaphore(REGISTRY_CONCURRENCY)
+
+    # Identical schemas under the same subject are registered once and share the ID
+    keys = [f"{subject}:{schema_fingerprint(schema)}" for subject, schema in registrations]
+    unique = {}
+    for key, registration in zip(keys, registrations):
+        if key not in schema_id_cache:
+            unique.setdefault(key, registration)
 
-    return f"""```java
-package com.arcone.biopro.{service_name}.infrastructure.listener;
+    if unique:
+        schema_ids = await register_uncached(list(unique.values()), limit)
+        schema_id_cache.update((key, schema_id) for key, schema_id in zip(unique, schema_ids)
+                               if schema_id > 0)
+        ids_by_key = dict(zip(unique, schema_ids))
+    else:
+        ids_by_key = {}
 
-import com.arcone.biopro.{service_name}.domain.event.{event_name};
+    return [schema_id_cache.get(key, ids_by_key.get(key, -1)) for key in keys]
+
+
+async def register_uncached(registrations: List[Tuple[str, Dict[str, Any]]],
+                            limit: asyncio.Semaphore) -> List[int]:
+    """Register (subject, schema) pairs the ID cache could not answer"""
+    async with create_registry_client() as client:
+        registry_cache = await load_registry_cache(client, [subject for subject, _ in registrations],
+                                                   limit)
+        print(f"    {len(registry_cache)} subjects already registered")
+
+        # Schemas sharing a subject are registered one after another in input order,
+        # keeping version order and the 409 "latest" fallback deterministic; only
+        # different subjects are registered concurrently
+        by_subject = defaultdict(list)
+        for idx, (subject, schema) in enumerate(registrations):
+            by_subject[subject].append((idx, schema))
+        schema_ids = [-1] * len(registrations)
+
+        async def register_subject(subject: str, entries: List[Tuple[int, Dict[str, Any]]]):
+            for idx, schema in entries:
+                schema_ids[idx] = await register_schema(client, subject, schema, limit, registry_cache)
+
+        await asyncio.gather(*[register_subject(subject, entries) for subject, entries in by_subject.items()])
+        return schema_ids
+
+
+def page_signature(entries: List[Tuple[Dict[str, Any], Dict[str, Any], Any]]) -> str:
+    """Hash every (event, schema, flow) that renders into one event page"""
+    canonical = _dumps(entries, sort_keys=True)
+    return hashlib.blake2b(canonical, digest_size=16).hexdigest()
+
+
+def load_inventory(path: str) -> Any:
+    """Read and parse an inventory JSON file"""
+    with open(path, 'rb') as f:
+        return _loads(f.read())
+
+
+def page_cache_key() -> str:
+    """Identify the page rendering and registry that page cache entries are valid for"""
+    templates = "\0".join(template.template for template in
+                          (_DLQ_TEMPLATE, EVENT_MDX_HEAD_TEMPLATE, EVENT_MDX_TAIL_TEMPLATE))
+    digest = hashlib.blake2b(templates.encode(), digest_size=8).hexdigest()
+    return f"{_PAGE_CACHE_VERSION}:{digest}:{SCHEMA_REGISTRY_URL}"
+
+
+def load_run_cache(path: str, key: str) -> Dict[str, Any]:
+    """Load the cache the previous run recorded under key, or an empty one"""
+    try:
+        with open(path, 'rb') as f:
+            cache = _loads(f.read())
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(cache, dict) or cache.get("key") != key:
+        return {}
+    return cache["entries"]
+
+
+def save_run_cache(path: str, key: str, cache: Dict[str, Any]):
+    """Record a cache for the next run, valid only for runs with the same key"""
+    with open(path, 'wb') as f:
+        f.write(_dumps({"key": key, "entries": cache}, sort_keys=True))
+
+
+_DLQ_TEMPLATE = string.Template("""```java
+package com.arcone.biopro.$service_name.infrastructure.listener;
+
+import com.arcone.biopro.$service_name.domain.event.$event_name;
 import com.arcone.biopro.common.infrastructure.listener.AbstractListener;
 import lombok.RequiredArgsConstructor;
 import lombok.extern.slf4j.Slf4j;
@@ -217,115 +448,106 @@ import reactor.core.publisher.Mono;
 @Slf4j
 @Service
 @RequiredArgsConstructor
-public class {event_name}Listener extends AbstractListener<{event_name}> {{
+public class ${event_name}Listener extends AbstractListener<$event_name> {
 
     private final YourBusinessService businessService;
 
     @KafkaListener(
-        topics = "${{kafka.topics.{topic_name}}}",
-        groupId = "${{kafka.consumer.group-id}}",
+        topics = "$${kafka.topics.$topic_name}",
+        groupId = "$${kafka.consumer.group-id}",
         containerFactory = "kafkaListenerContainerFactory",
         errorHandler = "kafkaListenerErrorHandler"
     )
     public void listen(
-            @Payload {event_name} event,
+            @Payload $event_name event,
             @Header(KafkaHeaders.RECEIVED_TOPIC) String topic,
             @Header(KafkaHeaders.RECEIVED_PARTITION) int partition,
             @Header(KafkaHeaders.OFFSET) long offset
-    ) {{
-        log.info("Received {event_name}: eventId={{}}, topic={{}}, partition={{}}, offset={{}}",
+    ) {
+        log.info("Received $event_name: eventId={}, topic={}, partition={}, offset={}",
                 event.getEventId(), topic, partition, offset);
 
         processMessage(event)
             .doOnSuccess(result ->
-                log.info("Successfully processed {event_name}: {{}}", event.getEventId()))
+                log.info("Successfully processed $event_name: {}", event.getEventId()))
             .doOnError(error ->
-                log.error("Failed to process {event_name}: {{}}", event.getEventId(), error))
+                log.error("Failed to process $event_name: {}", event.getEventId(), error))
             .subscribe();
-    }}
+    }
 
     @Override
-    protected Mono<{event_name}> processMessage({event_name} event) {{
-        return Mono.defer(() -> {{
-            try {{
+    protected Mono<$event_name> processMessage($event_name event) {
+        return Mono.defer(() -> {
+            try {
                 validateEvent(event);
                 return businessService.handle(event)
                     .doOnError(this::handleBusinessError)
                     .onErrorResume(this::recoverFromError);
-            }} catch (InvalidEventException e) {{
-                log.error("Invalid event detected - routing to DLQ: {{}}", event.getEventId(), e);
+            } catch (InvalidEventException e) {
+                log.error("Invalid event detected - routing to DLQ: {}", event.getEventId(), e);
                 sendToDLQ(event, e);
                 return Mono.empty();
-            }} catch (Exception e) {{
+            } catch (Exception e) {
                 return handleUnexpectedError(event, e);
-            }}
-        }});
-    }}
+            }
+        });
+    }
 
-    private void validateEvent({event_name} event) {{
-        if (event.getEventId() == null || event.getEventId().isEmpty()) {{
+    private void validateEvent($event_name event) {
+        if (event.getEventId() == null || event.getEventId().isEmpty()) {
             throw new InvalidEventException("Event ID is required");
-        }}
+        }
         // Add domain-specific validations
-    }}
-}}
-```"""
-
-
-def create_eventcatalog_mdx(event: Dict[str, Any], schema_id: int, avro_schema: Dict[str, Any],
-                            event_flows: Dict[str, Any]) -> str:
-    """Create EventCatalog MDX documentation"""
-    event_id = event['name'].replace('Event', '')
-    service_name = event.get('service', 'unknown')
-    domain = SERVICE_DOMAINS.get(service_name, 'General')
+    }
+}
+```""")
 
-    # Get publishers and consumers from event flows
-    flow = event_flows.get(event['name'], {"publishers": [], "consumers": []})
-    publishers = flow.get('publishers', [service_name])
-    consumers = flow.get('consumers', [])
 
-    # Ensure the service is in publishers
-    if service_name not in publishers:
-        publishers.append(service_name)
+@lru_cache(maxsize=4096)
+def create_dlq_listener_code(event_name: str, service_name: str) -> str:
+    """Generate DLQ-aware Spring Boot listener code"""
+    return _DLQ_TEMPLATE.substitute(
+        event_name=event_name,
+        service_name=service_name,
+        topic_name=event_name.replace('Event', '').lower(),
+    )
 
-    # Format consumers list
-    consumers_yaml = "\n".join(f"  - {c}-service" for c in consumers) if consumers else "  []"
 
-    content = f"""---
-id: {event_id}
-name: {event_id}
-version: '{event.get('version', '1.0')}'
-summary: Event published by {service_name} service when {event.get('type', 'event').lower().replace('_', ' ')} occurs
+EVENT_MDX_HEAD_TEMPLATE = string.Template("""---
+id: $event_id
+name: $event_id
+version: '$version'
+summary: Event published by $service_name service when $occurrence occurs
 owners:
-  - {service_name}-service
+  - $service_name-service
 producers:
-  - {service_name}-service
+  - $service_name-service
 consumers:
-{consumers_yaml}
+$consumers_yaml
 badges:
   - content: "Schema Valid ✓"
     backgroundColor: "#22c55e"
     textColor: white
-  - content: "Domain: {domain}"
+  - content: "Domain: $domain"
     backgroundColor: "#3b82f6"
     textColor: white
-  - content: "v{event.get('version', '1.0')}"
+  - content: "v$version"
     backgroundColor: "#6366f1"
     textColor: white
 ---
 
-# {event_id} Event
+# $event_id Event
 
-**Schema ID**: {schema_id}
-**Schema Version**: {event.get('version', '1.0')}
-**Subject**: {event['name']}
-**Domain**: {domain}
-**Service**: {service_name}-service
-**Repository**: {event.get('repository', 'unknown')}
+**Schema ID**: $schema_id
+**Schema Version**: $version
+**Subject**: $subject
+**Domain**: $domain
+**Service**: $service_name-service
+**Repository**: $repository
 
 ## Business Context
 
-Event published when {event.get('type', 'event').lower().replace('_', ' ')} occurs in the {service_name} service.
+Event published when $occurrence occurs in the $service_name service.
 
 ## Event Schema Fields
 
@@ -335,95 +557,130 @@ Event published when {event.get('type', 'event').lower().replace('_', ' ')} occu
 | occurredOn | timestamp-millis | Yes | When the event occurred |
 | eventType | string | Yes | Event type identifier |
 | eventVersion | string | Yes | Schema version |
-{chr(10).join(f'| {f["name"]} | {f["type"]} | {"Yes" if f.get("required", False) else "No"} | {f.get("description", "")} |' for f in event.get('fields', []))}
+""")
+
+EVENT_MDX_TAIL_TEMPLATE = string.Template("""
 
 ## Consumer Implementation with DLQ Support
 
 ### Spring Boot Kafka Listener
 
-{create_dlq_listener_code(event['name'], service_name)}
+$listener_code
 
 ## Complete Avro Schema
 
 ```json
-{json.dumps(avro_schema, indent=2)}
+$schema_json
 ```
 
 ## Change Log
 
-### v{event.get('version', '1.0')} ({datetime.now().strftime('%Y-%m-%d')})
-- Schema registered with ID {schema_id}
+### v$version ($date)
+- Schema registered with ID $schema_id
 - Integrated with Schema Registry
 - DLQ error handling configured
 
 <NodeGraph />
-"""
+""")
 
-    return content
 
+def create_eventcatalog_mdx(event: Dict[str, Any], schema_id: int, avro_schema: Dict[str, Any],
+                            event_flows: Dict[str, Any], field_rows: str, today: str) -> List[str]:
+    """Create EventCatalog MDX documentation as a list of chunks to write in order"""
+    event_id = event['name'].replace('Event', '')
+    service_name = event.get('service', 'unknown')
+    domain = SERVICE_DOMAINS[service_name]
+    version = event.get('version', '1.0')
 
-def create_service_mdx(service: Dict[str, Any], all_events: List[Dict[str, Any]],
-                       event_flows: Dict[str, Any]) -> str:
-    """Create service definition MDX page"""
-    service_name = service['name']
-    domain = SERVICE_DOMAINS.get(service_name, 'General')
-    repository = service.get('repository', 'unknown')
+    # Get publishers and consumers from event flows
+    flow = event_flows.get(event['name'], {"publishers": [], "consumers": []})
+    publishers = flow.get('publishers', [service_name])
+    consumers = flow.get('consumers', [])
 
-    # Get all events this service publishes
-    published_events = service.get('published_events', [])
+    # Ensure the service is in publishers
+    if service_name not in publishers:
+        publishers.append(service_name)
 
-    # Get all events this service consumes
-    consumed_events = []
+    # Format consumers list
+    consumers_yaml = "\n".join([f"  - {c}-service" for c in consumers]) if consumers else "  []"
+
+    occurrence = event.get('type', 'event').lower().replace('_', ' ')
+
+    head = EVENT_MDX_HEAD_TEMPLATE.substitute(
+        event_id=event_id,
+        version=version,
+        service_name=service_name,
+        occurrence=occurrence,
+        consumers_yaml=consumers_yaml,
+        domain=domain,
+        schema_id=schema_id,
+        subject=event['name'],
+        repository=event.get('repository', 'unknown'),
+    )
+    tail = EVENT_MDX_TAIL_TEMPLATE.substitute(
+        version=version,
+        schema_id=schema_id,
+        listener_code=create_dlq_listener_code(event['name'], service_name),
+        schema_json=_dumps_indent(avro_schema),
+        date=today,
+    )
+    return [head, field_rows, tail]
+
+
+def build_consumers_index(event_flows: Dict[str, Any]) -> Dict[str, List[str]]:
+    """Map each service name to the event IDs it consumes, in event flow order"""
+    consumers_index = defaultdict(list)
     for event_name, flow in event_flows.items():
-        if service_name in flow.get('consumers', []):
-            consumed_events.append(event_name.replace('Event', ''))
+        event_id = event_name.replace('Event', '')
+        for consumer in set(flow.get('consumers', [])):
+            consumers_index[consumer].append(event_id)
+    return consumers_index
 
-    # Format sends/receives lists
-    sends_yaml = "\n".join(f"    - id: {e.replace('Event', '')}\n      version: '1.0'"
-                          for e in published_events) if published_events else "    []"
-    receives_yaml = "\n".join(f"    - id: {e}\n      version: '1.0'"
-                             for e in consumed_events) if consumed_events else "    []"
-
-    content = f"""---
-id: {service_name}-service
-name: {service_name.title()} Service
-summary: BioPro {domain} domain service
+
+SERVICE_MDX_HEAD_TEMPLATE = string.Template("""---
+id: $service_name-service
+name: $title Service
+summary: BioPro $domain domain service
 badges:
-  - content: "Domain: {domain}"
+  - content: "Domain: $domain"
     backgroundColor: "#3b82f6"
     textColor: white
-  - content: "Repository: {repository}"
+  - content: "Repository: $repository"
     backgroundColor: "#6366f1"
     textColor: white
-  - content: "Events: {service.get('events_published', 0)} published"
+  - content: "Events: $events_published published"
     backgroundColor: "#22c55e"
     textColor: white
 sends:
-{sends_yaml}
+$sends_yaml
 receives:
-{receives_yaml}
+$receives_yaml
 ---
 
-# {service_name.title()} Service
+# $title Service
 
-**Domain**: {domain}
-**Repository**: {repository}
+**Domain**: $domain
+**Repository**: $repository
 
 ## Overview
 
-The {service_name} service is responsible for handling {service_name} operations within the BioPro {domain} domain.
+The $service_name service is responsible for handling $service_name operations within the BioPro $domain domain.
 
 ## Events Published
 
-This service publishes {service.get('events_published', 0)} events:
+This service publishes $events_published events:
 
-{chr(10).join(f'- **{e.replace("Event", "")}**: {e}' for e in published_events) if published_events else '- None'}
+""")
+
+SERVICE_MDX_CONSUMED_TEMPLATE = string.Template("""
 
 ## Events Consumed
 
-This service consumes {len(consumed_events)} events:
+This service consumes $consumed_count events:
+
+""")
 
-{chr(10).join(f'- **{e}**: Consumed from upstream services' for e in consumed_events) if consumed_events else '- None'}
+SERVICE_MDX_TAIL = """
 
 ## Technology Stack
 
@@ -435,18 +692,91 @@ This service consumes {len(consumed_events)} events:
 <NodeGraph />
 """
 
-    return content
+
+def create_service_mdx(service: Dict[str, Any], consumers_index: Dict[str, List[str]]) -> List[str]:
+    """Create service definition MDX page as a list of chunks to write in order"""
+    service_name = service['name']
+
+    # Get all events this service publishes
+    published_events = service.get('published_events', [])
+
+    # Get all events this service consumes
+    consumed_events = consumers_index.get(service_name, [])
+
+    # Format sends/receives lists
+    if published_events:
+        sends_yaml = "\n".join([f"    - id: {e.replace('Event', '')}\n      version: '1.0'"
+                                for e in published_events])
+        published_list = "\n".join([f"- **{e.replace('Event', '')}**: {e}" for e in published_events])
+    else:
+        sends_yaml = "    []"
+        published_list = "- None"
+    if consumed_events:
+        receives_yaml = "\n".join([f"    - id: {e}\n      version: '1.0'" for e in consumed_events])
+        consumed_list = "\n".join([f"- **{e}**: Consumed from upstream services" for e in consumed_events])
+    else:
+        receives_yaml = "    []"
+        consumed_list = "- None"
+
+    head = SERVICE_MDX_HEAD_TEMPLATE.substitute(
+        service_name=service_name,
+        title=service_name.title(),
+        domain=SERVICE_DOMAINS[service_name],
+        repository=service.get('repository', 'unknown'),
+        events_published=service.get('events_published', 0),
+        sends_yaml=sends_yaml,
+        receives_yaml=receives_yaml,
+    )
+    consumed_header = SERVICE_MDX_CONSUMED_TEMPLATE.substitute(consumed_count=len(consumed_events))
+    return [head, published_list, consumed_header, consumed_list, SERVICE_MDX_TAIL]
+
+
+def existing_subdirs(parent: str) -> set:
+    """Snapshot the subdirectory paths of parent with a single directory scan"""
+    try:
+        with os.scandir(parent) as entries:
+            return {entry.path for entry in entries if entry.is_dir()}
+    except FileNotFoundError:
+        return set()
+
+
+def write_mdx_files(pages: Dict[str, List[str]]):
+    """Stream rendered pages (path -> chunks) to disk concurrently, creating directories first"""
+    directories = {os.path.dirname(path) for path in pages}
+    existing = set()
+    for parent in {os.path.dirname(directory) for directory in directories}:
+        existing |= existing_subdirs(parent)
+    for directory in directories - existing:
+        os.makedirs(directory, exist_ok=True)
+
+    def write_page(item):
+        path, chunks = item
+        with open(path, 'w', encoding='utf-8', buffering=1 << 16) as f:
+            f.writelines(chunks)
+
+    with ThreadPoolExecutor(max_workers=WRITE_CONCURRENCY) as pool:
+        list(pool.map(write_page, pages.items()))
 
 
 def main():
+    today = datetime.now().strftime('%Y-%m-%d')
+
     print("=" * 80)
     print("BioPro Complete EventCatalog Generator")
     print("=" * 80)
 
-    # Load complete inventory
+    # Load complete inventory, reading the previous run's caches alongside it.
+    # Schema IDs are only reused against the same registry, and pages only when
+    # that registry and the page rendering are also unchanged
     print(f"\n[1] Loading complete inventory from {COMPLETE_INVENTORY_FILE}...")
-    with open(COMPLETE_INVENTORY_FILE, 'r') as f:
-        complete_data = json.load(f)
+    page_key = page_cache_key()
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        inventory_future = pool.submit(load_inventory, COMPLETE_INVENTORY_FILE)
+        page_cache_future = pool.submit(load_run_cache, PAGE_CACHE_FILE, page_key)
+        schema_id_cache_future = pool.submit(load_run_cache, SCHEMA_ID_CACHE_FILE, SCHEMA_REGISTRY_URL)
+        complete_data = inventory_future.result()
+        previous_cache = page_cache_future.result()
+        schema_id_cache = schema_id_cache_future.result()
 
     all_events = complete_data.get('events', [])
     all_services = complete_data.get('services', [])
@@ -458,70 +788,95 @@ def main():
     os.makedirs(EVENTCATALOG_EVENTS_DIR, exist_ok=True)
     os.makedirs(EVENTCATALOG_SERVICES_DIR, exist_ok=True)
 
+    # Build all schemas up front and group events by the page they render into
+    # (a later event with the same name wins the page)
+    built_schemas = [create_avro_schema_from_complete_event(event) for event in all_events]
+    event_files = [os.path.join(EVENTCATALOG_EVENTS_DIR, event['name'].replace('Event', ''), 'index.mdx')
+                   for event in all_events]
+    page_entries = defaultdict(list)
+    for event, (avro_schema, _), mdx_file in zip(all_events, built_schemas, event_files):
+        page_entries[mdx_file].append((event, avro_schema, event_flows.get(event['name'])))
+
+    # Pages whose inputs match the previous run and still exist on disk are
+    # neither re-registered nor rewritten
+    page_sigs = {mdx_file: page_signature(entries) for mdx_file, entries in page_entries.items()}
+    unchanged = {mdx_file for mdx_file, sig in page_sigs.items()
+                 if previous_cache.get(mdx_file) == sig and os.path.exists(mdx_file)}
+
+    # Register the remaining schemas concurrently
+    print(f"\n[2] Creating and registering {len(all_events)} Avro schemas...")
+    pending = [idx for idx, mdx_file in enumerate(event_files) if mdx_file not in unchanged]
+    registrations = [(f"{all_events[idx]['name']}-value", built_schemas[idx][0]) for idx in pending]
+    print(f"    {len(all_events) - len(pending)} events unchanged since last run")
+    schema_ids = dict(zip(pending, asyncio.run(register_schemas(registrations, schema_id_cache))))
+    save_run_cache(SCHEMA_ID_CACHE_FILE, SCHEMA_REGISTRY_URL, schema_id_cache)
+
     # Process each event
-    print(f"\n[2] Processing events...")
+    print(f"\n[3] Processing events...")
     registered_count = 0
     created_count = 0
+    skipped_count = 0
+    event_pages = {}
+    page_cache = {mdx_file: previous_cache[mdx_file] for mdx_file in unchanged}
 
-    for idx, event in enumerate(all_events, 1):
+    for idx, (event, (avro_schema, field_rows), mdx_file) in enumerate(
+            zip(all_events, built_schemas, event_files)):
         event_name = event['name']
         service_name = event.get('service', 'unknown')
 
-        print(f"\n    [{idx}/{len(all_events)}] {event_name} ({service_name})...")
+        print(f"\n    [{idx + 1}/{len(all_events)}] {event_name} ({service_name})...")
 
-        # Create Avro schema
-        avro_schema = create_avro_schema_from_complete_event(event)
-        print(f"        [OK] Created Avro schema")
-
-        # Register schema
-        subject = f"{event_name}-value"
-        schema_id = register_schema(subject, avro_schema)
+        if mdx_file in unchanged:
+            print(f"        [SKIP] Unchanged since last run")
+            skipped_count += 1
+            continue
 
+        schema_id = schema_ids[idx]
         if schema_id > 0:
             print(f"        [OK] Registered schema with ID: {schema_id}")
             registered_count += 1
+            page_cache[mdx_file] = page_sigs[mdx_file]
         else:
             print(f"        [WARNING] Failed to register schema (using placeholder)")
             schema_id = 999
+            # Never cache a page rendered with the placeholder ID
+            page_cache.pop(mdx_file, None)
 
-        # Create EventCatalog documentation
-        event_dir = os.path.join(EVENTCATALOG_EVENTS_DIR, event_name.replace('Event', ''))
-        os.makedirs(event_dir, exist_ok=True)
-
-        mdx_content = create_eventcatalog_mdx(event, schema_id, avro_schema, event_flows)
-        mdx_file = os.path.join(event_dir, 'index.mdx')
-
-        with open(mdx_file, 'w', encoding='utf-8') as f:
-            f.write(mdx_content)
+        # Create EventCatalog documentation (a later event with the same name wins)
+        event_pages[mdx_file] = create_eventcatalog_mdx(event, schema_id, avro_schema, event_flows,
+                                                        field_rows, today)
 
         print(f"        [OK] Created EventCatalog page")
         created_count += 1
 
+    write_mdx_files(event_pages)
+    save_run_cache(PAGE_CACHE_FILE, page_key, page_cache)
+
     # Process each service
-    print(f"\n[3] Creating service pages...")
+    print(f"\n[4] Creating service pages...")
     service_count = 0
+    consumers_index = build_consumers_index(event_flows)
+    service_pages = {}
 
     for service in all_services:
         service_name = service['name']
         print(f"    Creating service page for {service_name}...")
 
         service_dir = os.path.join(EVENTCATALOG_SERVICES_DIR, f"{service_name}-service")
-        os.makedirs(service_dir, exist_ok=True)
-
-        mdx_content = create_service_mdx(service, all_events, event_flows)
         mdx_file = os.path.join(service_dir, 'index.mdx')
-
-        with open(mdx_file, 'w', encoding='utf-8') as f:
-            f.write(mdx_content)
+        service_pages[mdx_file] = create_service_mdx(service, consumers_index)
 
         service_count += 1
 
+    write_mdx_files(service_pages)
+
     print("\n" + "=" * 80)
     print("SUMMARY")
     print("=" * 80)
     print(f"Total events processed: {len(all_events)}")
     print(f"Schemas registered: {registered_count}")
     print(f"EventCatalog event pages created: {created_count}")
+    print(f"Unchanged events skipped: {skipped_count}")
     print(f"EventCatalog service pages created: {service_count}")
     print(f"\nEventCatalog URL: http://localhost:3002")
     print(f"Schema Registry URL: {SCHEMA_REGISTRY_URL}")
@@ -7,19 +7,81 @@ This script:
 2. Generates Avro schemas for each event
 3. Registers schemas in Confluent Schema Registry
 4. Creates EventCatalog MDX documentation with DLQ-aware code examples
+
+The module is valid Cython source as-is; for faster schema and page generation
+compile it in place and run the compiled module (the .py stays as the
+pure-Python fallback):
+    cythonize -3 -i create_eventcatalog_from_biopro.py
+    python -c "import create_eventcatalog_from_biopro as c; c.main()"
+Python imports the compiled module in preference to the .py, so rerun cythonize
+after editing this file, or delete the build to run the source again:
+    rm -f create_eventcatalog_from_biopro.*.so create_eventcatalog_from_biopro.c
+A build older than the .py prints a warning on import.
 """
 
+import asyncio
+import hashlib
 import json
 import os
 import re
-import requests
+import string
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Tuple
+
+try:
+    import httpx
+except ImportError:
+    print("ERROR: httpx library not installed")
+    print("Install with: pip install 'httpx[http2]'")
+    sys.exit(1)
+
+try:
+    import h2  # noqa: F401 - enables HTTP/2 in httpx
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+try:
+    import orjson
+
+    def _dumps(obj: Any) -> str:
+        return orjson.dumps(obj).decode()
+
+    def _dumps_indent(obj: Any) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+
+    _loads = orjson.loads
+except ImportError:
+    _dumps = json.dumps
+
+    def _dumps_indent(obj: Any) -> str:
+        return json.dumps(obj, indent=2)
+
+    _loads = json.loads
+
+
+def _check_compiled_build():
+    """Warn when running a compiled build that is older than its .py source"""
+    module = Path(__file__)
+    source = module.with_name(module.name.split('.')[0] + '.py')
+    if module != source and source.exists() and source.stat().st_mtime > module.stat().st_mtime:
+        print(f"WARNING: {module.name} is older than {source.name}; rerun cythonize or delete the build")
+
+
+_check_compiled_build()
 
 # Configuration
 SCHEMA_REGISTRY_URL = "http://localhost:8081"
 EVENTCATALOG_EVENTS_DIR = "eventcatalog/events"
 INVENTORY_FILE = "biopro-events-inventory.json"
+SCHEMA_ID_CACHE_FILE = ".biopro_schema_id_cache.json"
+REGISTRY_CONCURRENCY = 32
+REGISTRY_RETRIES = 3
+RETRY_STATUSES = (502, 503, 504)
+WRITE_CONCURRENCY = 8
 
 # DLQ-aware listener template
 DLQ_LISTENER_TEMPLATE = """```java
@@ -150,8 +212,15 @@ public class {event_name}Listener extends AbstractListener<{event_name}> {{
 }}
 ```"""
 
+@lru_cache(maxsize=None)
+def render_listener(service: str, event_name: str, topic_name: str) -> str:
+    """Render the DLQ listener example for one event"""
+    return DLQ_LISTENER_TEMPLATE.format(service=service, event_name=event_name, topic_name=topic_name)
+
+
 # Error handler configuration template
-def get_error_handler_config(service_name):
+@lru_cache(maxsize=None)
+def get_error_handler_config(service_name: str) -> str:
     return f"""```yaml
 # application.yml - Kafka Error Handling Configuration
 
@@ -202,57 +271,77 @@ SERVICE_CONSUMERS = {
 }
 
 
-def java_type_to_avro_type(java_type: str) -> Dict[str, Any]:
-    """Convert Java type to Avro type"""
-    type_mapping = {
-        "String": "string",
-        "Integer": "int",
-        "Long": "long",
-        "Double": "double",
-        "Boolean": "boolean",
-        "ZonedDateTime": {"type": "long", "logicalType": "timestamp-millis"},
-        "LocalDate": {"type": "int", "logicalType": "date"},
-        "UUID": {"type": "string", "logicalType": "uuid"},
-    }
+# Java to Avro type mapping for simple types
+JAVA_TO_AVRO_TYPES = {
+    "String": "string",
+    "Integer": "int",
+    "Long": "long",
+    "Double": "double",
+    "Boolean": "boolean",
+    "ZonedDateTime": {"type": "long", "logicalType": "timestamp-millis"},
+    "LocalDate": {"type": "int", "logicalType": "date"},
+    "UUID": {"type": "string", "logicalType": "uuid"},
+}
 
-    # Handle List types
-    if java_type.startswith("List<"):
-        inner_type = java_type[5:-1]
-        return {
-            "type": "array",
-            "items": java_type_to_avro_type(inner_type)
-        }
+# Outermost List<...> / Optional<...> wrapper of a Java type
+GENERIC_TYPE_PATTERN = re.compile(r'^(List|Optional)<(.+)>$')
+
+
+@lru_cache(maxsize=None)
+def java_type_to_avro_type(java_type: str) -> Any:
+    """Convert Java type to Avro type
 
-    # Handle Optional/nullable
-    if java_type.startswith("Optional<"):
-        inner_type = java_type[9:-1]
-        return ["null", java_type_to_avro_type(inner_type)]
+    Results are memoized and shared between schemas, so treat them as read-only.
+    """
+    # Peel List/Optional wrappers down to the innermost type
+    wrappers = []
+    while (match := GENERIC_TYPE_PATTERN.match(java_type)):
+        wrappers.append(match.group(1))
+        java_type = match.group(2)
 
-    return type_mapping.get(java_type, "string")
+    avro_type = JAVA_TO_AVRO_TYPES.get(java_type, "string")
+
+    # Re-wrap from the inside out: List -> array, Optional -> nullable union
+    for wrapper in reversed(wrappers):
+        if wrapper == "List":
+            avro_type = {"type": "array", "items": avro_type}
+        else:
+            avro_type = ["null", avro_type]
+
+    return avro_type
+
+
+# Standard fields shared by every event schema; the dicts are reused across
+# schemas, so treat them as read-only
+STANDARD_FIELDS = (
+    {
+        "name": "eventId",
+        "type": {"type": "string", "logicalType": "uuid"},
+        "doc": "Unique identifier for this event"
+    },
+    {
+        "name": "occurredOn",
+        "type": {"type": "long", "logicalType": "timestamp-millis"},
+        "doc": "Timestamp when event occurred"
+    },
+    {
+        "name": "occurredOnTimeZone",
+        "type": "string",
+        "doc": "Timezone for occurredOn",
+        "default": "UTC"
+    },
+)
 
 
 def create_avro_schema(event: Dict[str, Any]) -> Dict[str, Any]:
     """Create Avro schema from event definition"""
-    namespace = f"com.arcone.biopro.{event['service']}.domain.event"
+    # Namespaces and field names repeat across events; intern them so every
+    # schema shares one copy and dict hashing reuses the cached hash
+    namespace = sys.intern(f"com.arcone.biopro.{event['service']}.domain.event")
 
-    # Build fields
+    # Build fields; only eventType and eventVersion vary per event
     fields = [
-        {
-            "name": "eventId",
-            "type": {"type": "string", "logicalType": "uuid"},
-            "doc": "Unique identifier for this event"
-        },
-        {
-            "name": "occurredOn",
-            "type": {"type": "long", "logicalType": "timestamp-millis"},
-            "doc": "Timestamp when event occurred"
-        },
-        {
-            "name": "occurredOnTimeZone",
-            "type": "string",
-            "doc": "Timezone for occurredOn",
-            "default": "UTC"
-        },
+        *STANDARD_FIELDS,
         {
             "name": "eventType",
             "type": "string",
@@ -271,7 +360,7 @@ def create_avro_schema(event: Dict[str, Any]) -> Dict[str, Any]:
     payload_fields = []
     for field in event.get('fields', []):
         payload_fields.append({
-            "name": field['name'],
+            "name": sys.intern(field['name']),
             "type": java_type_to_avro_type(field['type']),
             "doc": field.get('description', f"{field['name']} field")
         })
@@ -282,7 +371,7 @@ def create_avro_schema(event: Dict[str, Any]) -> Dict[str, Any]:
             "type": {
                 "type": "record",
                 "name": event['payload_class'],
-                "namespace": f"{namespace}.payload",
+                "namespace": sys.intern(f"{namespace}.payload"),
                 "doc": f"{event['event_name']} payload",
                 "fields": payload_fields
             },
@@ -300,64 +389,175 @@ def create_avro_schema(event: Dict[str, Any]) -> Dict[str, Any]:
     return schema
 
 
-def register_schema(subject: str, schema: Dict[str, Any]) -> int:
-    """Register schema in Schema Registry"""
+def schema_digest(schema_str: str) -> str:
+    """Hash a compact-serialized schema"""
+    return hashlib.blake2b(schema_str.encode('utf-8'), digest_size=16).hexdigest()
+
+
+def load_schema_id_cache() -> Dict[str, int]:
+    """Load the "subject:digest" -> schema ID map recorded by earlier runs"""
+    try:
+        with open(SCHEMA_ID_CACHE_FILE, 'rb') as f:
+            return _loads(f.read())
+    except (OSError, ValueError):
+        return {}
+
+
+def save_schema_id_cache(schema_id_cache: Dict[str, int]):
+    """Record schema IDs so the next run can skip unchanged registrations"""
+    with open(SCHEMA_ID_CACHE_FILE, 'w', encoding='utf-8') as f:
+        f.write(_dumps(schema_id_cache))
+
+
+async def registry_request(client: httpx.AsyncClient, method: str, url: str, limit: asyncio.Semaphore,
+                           **kwargs) -> httpx.Response:
+    """Send a registry request, retrying gateway/unavailable responses with exponential backoff"""
+    # Registering an existing schema returns its ID, so retrying a POST is safe
+    for attempt in range(REGISTRY_RETRIES):
+        async with limit:
+            response = await client.request(method, url, **kwargs)
+        if response.status_code not in RETRY_STATUSES:
+            return response
+        await asyncio.sleep(0.5 * 2 ** attempt)
+    async with limit:
+        return await client.request(method, url, **kwargs)
+
+
+async def load_latest_digests(client: httpx.AsyncClient, subjects: List[str],
+                              limit: asyncio.Semaphore) -> Dict[str, Tuple[int, str]]:
+    """Fetch the latest (schema ID, digest) of each given subject already in the registry"""
+    try:
+        response = await registry_request(client, "GET", f"{SCHEMA_REGISTRY_URL}/subjects", limit)
+        response.raise_for_status()
+        existing = set(response.json()).intersection(subjects)
+    except (httpx.HTTPError, ValueError) as e:
+        print(f"Could not list registry subjects: {e}")
+        return {}
+
+    async def fetch_latest(subject: str):
+        try:
+            latest = await registry_request(
+                client, "GET", f"{SCHEMA_REGISTRY_URL}/subjects/{subject}/versions/latest", limit)
+            latest.raise_for_status()
+            data = latest.json()
+            # Re-serialize so formatting differences in the stored schema don't matter
+            return subject, (data['id'], schema_digest(_dumps(_loads(data['schema']))))
+        except (httpx.HTTPError, ValueError, KeyError):
+            return subject, None
+
+    entries = await asyncio.gather(*[fetch_latest(subject) for subject in existing])
+    return {subject: entry for subject, entry in entries if entry}
+
+
+async def register_schema(client: httpx.AsyncClient, subject: str, schema_str: str,
+                          limit: asyncio.Semaphore) -> int:
+    """Register a compact-serialized schema in Schema Registry"""
     url = f"{SCHEMA_REGISTRY_URL}/subjects/{subject}/versions"
     headers = {"Content-Type": "application/vnd.schemaregistry.v1+json"}
-    payload = {"schema": json.dumps(schema)}
+    body = _dumps({"schema": schema_str})
 
     try:
-        response = requests.post(url, json=payload, headers=headers)
+        response = await registry_request(client, "POST", url, limit,
+                                          content=body.encode('utf-8'), headers=headers)
         response.raise_for_status()
         result = response.json()
         return result.get('id', -1)
-    except requests.exceptions.RequestException as e:
+    except (httpx.HTTPError, ValueError) as e:
         print(f"Error registering schema for {subject}: {e}")
         return -1
 
 
-def create_eventcatalog_mdx(event: Dict[str, Any], schema_id: int, avro_schema: Dict[str, Any]):
-    """Create EventCatalog MDX documentation"""
-    event_id = event['event_name'].replace('Event', '')
-    service_name = event['service']
+async def register_schemas(registrations: List[Tuple[str, str]],
+                           schema_id_cache: Dict[str, int]) -> List[int]:
+    """Register (subject, schema_str) pairs concurrently over one client, returning IDs in input order
 
-    # Determine consumers
-    consumers = SERVICE_CONSUMERS.get(event_id, [])
+    IDs found in schema_id_cache need no HTTP call; new successful
+    registrations are added to it.
+    """
+    limit = asyncio.Semaphore(REGISTRY_CONCURRENCY)
+
+    # Byte-identical schemas under the same subject are registered once and share the ID
+    digests = [schema_digest(schema_str) for _, schema_str in registrations]
+    keys = [f"{subject}:{digest}" for (subject, _), digest in zip(registrations, digests)]
+    unique = {}
+    for key, registration, digest in zip(keys, registrations, digests):
+        if key not in schema_id_cache:
+            unique.setdefault(key, (*registration, digest))
+    if not unique:
+        return [schema_id_cache[key] for key in keys]
+
+    limits = httpx.Limits(max_keepalive_connections=REGISTRY_CONCURRENCY,
+                          max_connections=REGISTRY_CONCURRENCY, keepalive_expiry=60)
 
-    content = f"""---
-id: {event_id}
-name: {event_id}
-version: '{event['version']}'
-summary: Event published by {service_name} service when {event['event_type'].lower().replace('_', ' ')} occurs
+    # The transport retries failed connection attempts; registry_request covers 5xx responses
+    transport = httpx.AsyncHTTPTransport(http2=HTTP2_AVAILABLE, limits=limits, retries=REGISTRY_RETRIES)
+
+    async with httpx.AsyncClient(transport=transport, timeout=10) as client:
+        # Subjects whose latest version already holds this schema need no POST
+        latest = await load_latest_digests(client, [subject for subject, _, _ in unique.values()], limit)
+
+        async def register(subject: str, schema_str: str, digest: str) -> int:
+            if subject in latest and latest[subject][1] == digest:
+                return latest[subject][0]
+            return await register_schema(client, subject, schema_str, limit)
+
+        # Different schemas under one subject are registered one after another in
+        # input order, keeping the registry's version order deterministic; only
+        # different subjects are registered concurrently
+        by_subject = {}
+        for idx, registration in enumerate(unique.values()):
+            by_subject.setdefault(registration[0], []).append((idx, registration))
+        schema_ids = [-1] * len(unique)
+
+        async def register_subject(entries: List[Tuple[int, Tuple[str, str, str]]]):
+            for idx, registration in entries:
+                schema_ids[idx] = await register(*registration)
+
+        await asyncio.gather(*[register_subject(entries) for entries in by_subject.values()])
+
+    for key, schema_id in zip(unique, schema_ids):
+        if schema_id > 0:
+            schema_id_cache[key] = schema_id
+    ids_by_key = dict(zip(unique, schema_ids))
+    return [schema_id_cache.get(key, ids_by_key.get(key, -1)) for key in keys]
+
+
+# Event page sections around the listener, error-handler and schema chunks;
+# service-level placeholders are filled once per service by service_templates
+EVENT_MDX_HEADER_TEMPLATE = string.Template("""---
+id: $event_id
+name: $event_id
+version: '$version'
+summary: Event published by $service_name service when $occurrence occurs
 owners:
-  - {service_name}-service
+  - $service_name-service
 producers:
-  - {service_name}-service
+  - $service_name-service
 consumers:
-{chr(10).join(f'  - {c}' for c in consumers) if consumers else '  []'}
+$consumers_block
 badges:
   - content: "Schema Valid ✓"
     backgroundColor: "#22c55e"
     textColor: white
-  - content: "Team: {service_name.title()}"
+  - content: "Team: $service_title"
     backgroundColor: "#3b82f6"
     textColor: white
-  - content: "v{event['version']}"
+  - content: "v$version"
     backgroundColor: "#6366f1"
     textColor: white
 ---
 
-# {event_id} Event
+# $event_id Event
 
-**Schema ID**: {schema_id}
-**Schema Version**: {event['version']}
-**Subject**: {event['event_name']}
-**Domain**: {service_name.title()}
-**Service**: {service_name}-service
+**Schema ID**: $schema_id
+**Schema Version**: $version
+**Subject**: $event_name
+**Domain**: $service_title
+**Service**: $service_name-service
 
 ## Business Context
 
-{event.get('purpose', f'Event published when {event["event_type"].lower().replace("_", " ")} occurs in the {service_name} service.')}
+$purpose
 
 ## Event Schema Fields
 
@@ -367,21 +567,15 @@ badges:
 | occurredOn | timestamp-millis | Yes | When the event occurred |
 | eventType | string | Yes | Event type identifier |
 | eventVersion | string | Yes | Schema version |
-{chr(10).join(f'| {f["name"]} | {f["type"]} | {"Yes" if f.get("required", False) else "No"} | {f.get("description", "")} |' for f in event.get('fields', []))}
+$field_rows
 
 ## Consumer Implementation with DLQ Support
 
 ### Spring Boot Kafka Listener
 
-{DLQ_LISTENER_TEMPLATE.format(
-    service=service_name,
-    event_name=event['event_name'],
-    topic_name=event['event_type'].lower().replace('_', '.')
-)}
-
-### Error Handling Configuration
+""")
 
-{get_error_handler_config(service_name)}
+EVENT_MDX_DASHBOARD_TEMPLATE = string.Template("""
 
 ### DLQ Monitoring Dashboard
 
@@ -391,52 +585,122 @@ badges:
 apiVersion: v1
 kind: ConfigMap
 metadata:
-  name: {service_name}-dlq-dashboard
+  name: $service_name-dlq-dashboard
 data:
   dashboard.json: |
-    {{
-      "title": "{event_id} DLQ Monitor",
+    {
+      "title": "$event_id DLQ Monitor",
       "panels": [
-        {{
+        {
           "title": "DLQ Message Rate",
           "targets": [
-            {{
-              "expr": "rate(kafka_consumer_records_consumed_total{{topic=~\\\".*{event['event_type'].lower()}.DLQ\\\"}}[5m])"
-            }}
+            {
+              "expr": "rate(kafka_consumer_records_consumed_total{topic=~\\\".*$topic.DLQ\\\"}[5m])"
+            }
           ]
-        }},
-        {{
+        },
+        {
           "title": "Processing Errors",
           "targets": [
-            {{
-              "expr": "rate(kafka_consumer_fetch_manager_records_consumed_total{{topic=\\\"{event['event_type'].lower()}\\\"}}[5m]) - rate(kafka_consumer_records_consumed_total{{topic=\\\"{event['event_type'].lower()}\\\"}}[5m])"
-            }}
+            {
+              "expr": "rate(kafka_consumer_fetch_manager_records_consumed_total{topic=\\\"$topic\\\"}[5m]) - rate(kafka_consumer_records_consumed_total{topic=\\\"$topic\\\"}[5m])"
+            }
           ]
-        }}
+        }
       ]
-    }}
+    }
 ```
 
 ## Complete Avro Schema
 
 ```json
-{json.dumps(avro_schema, indent=2)}
+""")
+
+EVENT_MDX_CHANGE_LOG_TEMPLATE = string.Template("""
 ```
 
 ## Change Log
 
-### v{event['version']} ({get_current_date()})
-- Schema registered with ID {schema_id}
+### v$version ($date)
+- Schema registered with ID $schema_id
 - Integrated with Schema Registry
 - DLQ error handling configured
 
 <NodeGraph />
-"""
+""")
+
 
-    return content
+@lru_cache(maxsize=None)
+def service_templates(service_name: str) -> Tuple[string.Template, string.Template, string.Template]:
+    """Specialize the event page templates for one service, leaving the per-event placeholders"""
+    service_values = {"service_name": service_name, "service_title": service_name.title()}
+    return tuple(string.Template(template.safe_substitute(service_values))
+                 for template in (EVENT_MDX_HEADER_TEMPLATE, EVENT_MDX_DASHBOARD_TEMPLATE,
+                                  EVENT_MDX_CHANGE_LOG_TEMPLATE))
 
 
-def get_current_date():
+def create_eventcatalog_mdx(event: Dict[str, Any], schema_id: int, avro_schema: Dict[str, Any]) -> List[str]:
+    """Create EventCatalog MDX documentation as a list of chunks to write in order"""
+    event_id = event['event_name'].replace('Event', '')
+    service_name = event['service']
+
+    # Determine consumers
+    consumers = SERVICE_CONSUMERS.get(event_id, [])
+    consumers_block = "\n".join([f"  - {c}" for c in consumers]) if consumers else "  []"
+
+    # Event-specific rows of the schema field table
+    field_rows = "\n".join([
+        f"| {field['name']} | {field['type']} | {'Yes' if field.get('required', False) else 'No'} "
+        f"| {field.get('description', '')} |"
+        for field in event.get('fields', [])
+    ])
+
+    occurrence = event['event_type'].lower().replace('_', ' ')
+    header_template, dashboard_template, change_log_template = service_templates(service_name)
+
+    header = header_template.substitute(
+        event_id=event_id,
+        event_name=event['event_name'],
+        version=event['version'],
+        occurrence=occurrence,
+        consumers_block=consumers_block,
+        schema_id=schema_id,
+        purpose=event.get('purpose', f"Event published when {occurrence} occurs in the {service_name} service."),
+        field_rows=field_rows,
+    )
+    dashboard = dashboard_template.substitute(event_id=event_id, topic=event['event_type'].lower())
+    change_log = change_log_template.substitute(version=event['version'], date=get_current_date(),
+                                                schema_id=schema_id)
+
+    # The listener, error-handler config and schema are written as their own
+    # chunks rather than copied into one page-sized string
+    return [
+        header,
+        render_listener(service_name, event['event_name'], event['event_type'].lower().replace('_', '.')),
+        "\n\n### Error Handling Configuration\n\n",
+        get_error_handler_config(service_name),
+        dashboard,
+        _dumps_indent(avro_schema),
+        change_log,
+    ]
+
+
+def write_mdx_files(pages: Dict[str, List[str]]):
+    """Stream rendered pages (path -> chunks) to disk concurrently, creating directories first"""
+    for directory in sorted({os.path.dirname(path) for path in pages}):
+        os.makedirs(directory, exist_ok=True)
+
+    def write_page(item):
+        path, chunks = item
+        # Binary mode skips the TextIOWrapper encoder; each chunk is encoded once
+        with open(path, 'wb', buffering=1 << 16) as f:
+            f.writelines([chunk.encode('utf-8') for chunk in chunks])
+
+    with ThreadPoolExecutor(max_workers=WRITE_CONCURRENCY) as pool:
+        list(pool.map(write_page, pages.items()))
+
+
+def get_current_date() -> str:
     """Get current date in YYYY-MM-DD format"""
     from datetime import datetime
     return datetime.now().strftime("%Y-%m-%d")
@@ -448,30 +712,32 @@ def main():
 
     # Load inventory
     print(f"\n1. Loading inventory from {INVENTORY_FILE}...")
-    with open(INVENTORY_FILE, 'r') as f:
-        events = json.load(f)
+    with open(INVENTORY_FILE, 'rb') as f:
+        events = _loads(f.read())
 
     print(f"   Found {len(events)} events")
 
     # Create EventCatalog directory if not exists
     os.makedirs(EVENTCATALOG_EVENTS_DIR, exist_ok=True)
 
+    # Build all schemas up front and register them concurrently
+    avro_schemas = [create_avro_schema(event) for event in events]
+    schema_id_cache = load_schema_id_cache()
+    schema_ids = asyncio.run(register_schemas([(f"{event['event_name']}-value", _dumps(avro_schema))
+                                               for event, avro_schema in zip(events, avro_schemas)],
+                                              schema_id_cache))
+    save_schema_id_cache(schema_id_cache)
+
     # Process each event
     registered_count = 0
     created_count = 0
+    pages = {}
 
-    for idx, event in enumerate(events, 1):
+    for idx, (event, avro_schema, schema_id) in enumerate(zip(events, avro_schemas, schema_ids), 1):
         event_name = event['event_name']
         print(f"\n{idx}. Processing {event_name}...")
-
-        # Create Avro schema
-        avro_schema = create_avro_schema(event)
         print(f"   [OK] Created Avro schema")
 
-        # Register schema
-        subject = f"{event_name}-value"
-        schema_id = register_schema(subject, avro_schema)
-
         if schema_id > 0:
             print(f"   [OK] Registered schema with ID: {schema_id}")
             registered_count += 1
@@ -479,19 +745,16 @@ def main():
             print(f"   [FAIL] Failed to register schema")
             schema_id = 999  # Placeholder for documentation
 
-        # Create EventCatalog documentation
+        # Create EventCatalog documentation (a later event with the same name wins)
         event_dir = os.path.join(EVENTCATALOG_EVENTS_DIR, event_name.replace('Event', ''))
-        os.makedirs(event_dir, exist_ok=True)
-
-        mdx_content = create_eventcatalog_mdx(event, schema_id, avro_schema)
         mdx_file = os.path.join(event_dir, 'index.mdx')
-
-        with open(mdx_file, 'w', encoding='utf-8') as f:
-            f.write(mdx_content)
+        pages[mdx_file] = create_eventcatalog_mdx(event, schema_id, avro_schema)
 
         print(f"   [OK] Created EventCatalog documentation: {mdx_file}")
         created_count += 1
 
+    write_mdx_files(pages)
+
     print("\n" + "=" * 70)
     print("SUMMARY")
     print("=" * 70)
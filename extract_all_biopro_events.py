@@ -6,13 +6,99 @@ Analyzes all 13 manufacturing services and extracts complete event information
 
 import os
 import re
+import sys
 import json
+import mmap
 from pathlib import Path
-from typing import Dict, List, Set
+from typing import Any, Dict, FrozenSet, List, Optional, Set, Tuple
 from dataclasses import dataclass, field, asdict
 from collections import defaultdict
-
-@dataclass
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import cached_property, lru_cache
+from operator import attrgetter
+
+try:
+    import orjson  # Optional: C serializer with native dataclass support
+
+    def _dumps_indent(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+except ImportError:
+    def _dataclass_dict(obj: Any) -> Dict[str, Any]:
+        """Shallow dict of a dataclass; json visits nested dataclasses through default"""
+        return {name: getattr(obj, name) for name in obj.__dataclass_fields__}
+
+    def _dumps_indent(obj: Any) -> bytes:
+        return json.dumps(obj, indent=2, default=_dataclass_dict).encode('utf-8')
+
+# Reported as the generator in the markdown inventory
+SCRIPT_NAME = Path(__file__).name
+
+# Precompiled Java source patterns. Event sources are scanned as raw bytes since
+# every token of interest is ASCII; only the small captured groups get decoded.
+_CLASS_RE = re.compile(rb'public class (\w+Event)')
+_EVENT_TYPE_RE = re.compile(rb'EventType\.(\w+)\(\)')
+_VERSION_RE = re.compile(rb'EventVersion\.VERSION_(\d+_\d+)\(\)')
+_PAYLOAD_RE = re.compile(rb'extends Event<(\w+)>')
+# The class-level JavaDoc: the comment directly before the class declaration,
+# annotations aside. Annotation arguments may hold quoted strings and one level
+# of nested parentheses; the comment body cannot contain '*/', so each candidate
+# is scanned once
+_JAVADOC_RE = re.compile(
+    rb'/\*\*((?:[^*]|\*(?!/))*)\*/\s*'
+    rb'(?:@[\w.]+(?:\s*\((?:[^()"]|"[^"]*"|\([^()]*\))*\))?\s*)*'
+    rb'public\s+(?:class|record)')
+
+# Sources at least this large are memory-mapped rather than copied into memory
+_MMAP_THRESHOLD = 64 * 1024
+
+# Tokens of a record's parameter list, scanned in one pass from its opening
+# parenthesis: comments, @Schema annotations (body captured), other annotations,
+# `Type name` declarations and the closing parenthesis. Annotation bodies are
+# consumed whole, so their parentheses never end the record early.
+_RECORD_TOKEN_RE = re.compile(
+    r'//[^\n]*|/\*.*?\*/'
+    r'|@Schema\s*\((?P<schema>(?:[^()"]|"[^"]*")*)\)'
+    r'|@[\w.]+(?:\s*\((?:[^()"]|"[^"]*")*\))?'
+    r'|(?P<type>[A-Z][\w.]*(?:<[^()]*?>)?(?:\[\])*)\s+(?P<name>\w+)\s*(?=[,)])'
+    r'|(?P<end>\))',
+    re.DOTALL)
+
+# @Schema annotation attributes
+_SCHEMA_NAME_RE = re.compile(r'name\s*=\s*"([^"]+)"')
+_SCHEMA_DESC_RE = re.compile(r'description\s*=\s*"([^"]+)"')
+_SCHEMA_EXAMPLE_RE = re.compile(r'example\s*=\s*"([^"]+)"')
+_SCHEMA_REQUIRED_RE = re.compile(r'requiredMode\s*=\s*REQUIRED')
+
+@lru_cache(maxsize=None)
+def _record_re(payload_class: str):
+    """Compiled pattern for the header of the given payload record"""
+    return re.compile(r'public record ' + payload_class + r'\s*\(')
+
+def _text(token: bytes) -> str:
+    """Decode a captured source token"""
+    return token.decode('utf-8', 'ignore')
+
+def _read_source(file_path: Path):
+    """A source file's raw bytes; large files are memory-mapped instead of read"""
+    with open(file_path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size < _MMAP_THRESHOLD:
+            return f.read()
+        return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+def _dir_names(path) -> Optional[List[str]]:
+    """Names of the entries in a directory, or None if it doesn't exist"""
+    try:
+        with os.scandir(path) as entries:
+            return [entry.name for entry in entries]
+    except (FileNotFoundError, NotADirectoryError):
+        return None
+
+@lru_cache(maxsize=None)
+def _payload_files(payload_dir: Path) -> FrozenSet[str]:
+    """Names in an event directory's payload/ folder, listed once per process"""
+    return frozenset(_dir_names(payload_dir) or ())
+
+@dataclass(slots=True)
 class EventField:
     """Represents a field in an event payload"""
     name: str
@@ -21,7 +107,7 @@ class EventField:
     required: bool = False
     example: str = ""
 
-@dataclass
+@dataclass(slots=True)
 class EventSchema:
     """Represents a complete event schema"""
     service: str
@@ -38,6 +124,134 @@ class EventSchema:
     def to_dict(self):
         return asdict(self)
 
+def extract_event_from_file(service: str, file_path: Path) -> Tuple[Optional[EventSchema], List[str]]:
+    """Extract event schema from a Java file.
+
+    Module-level so worker processes can run it; warnings are returned rather
+    than printed so the caller can log them in file order.
+    """
+    warnings = []
+    content = None
+    try:
+        content = _read_source(file_path)
+
+        # Files without a class declaration can't match; skip the regexes
+        if content.find(b'public class ') == -1:
+            return None, warnings
+
+        # Extract class name
+        class_match = _CLASS_RE.search(content)
+        if not class_match:
+            return None, warnings
+        event_name = _text(class_match.group(1))
+
+        # Extract event type from EventType enum reference
+        event_type_match = _EVENT_TYPE_RE.search(content)
+        event_type = sys.intern(_text(event_type_match.group(1))) if event_type_match else event_name
+
+        # Extract version
+        version_match = _VERSION_RE.search(content)
+        version = sys.intern(_text(version_match.group(1)).replace('_', '.')) if version_match else "1.0"
+
+        # Extract payload class
+        payload_match = _PAYLOAD_RE.search(content)
+        payload_class = _text(payload_match.group(1)) if payload_match else "Unknown"
+
+        # Extract JavaDoc for purpose
+        javadoc_match = _JAVADOC_RE.search(content)
+        purpose = ""
+        if javadoc_match:
+            javadoc = _text(javadoc_match.group(1))
+            purpose = ' '.join(line.strip().lstrip('*').strip() for line in javadoc.split('\n') if line.strip())
+
+        # Service, type, version and field type names repeat across events;
+        # interned, each distinct value is stored (and pickled back) once
+        event = EventSchema(
+            service=sys.intern(service),
+            event_name=event_name,
+            event_type=event_type,
+            version=version,
+            payload_class=payload_class,
+            purpose=purpose,
+            file_path=str(file_path)
+        )
+
+        # Try to extract payload fields
+        if payload_class != "Unknown":
+            extract_payload_fields(service, payload_class, event, file_path, warnings)
+
+        return event, warnings
+
+    except Exception as e:
+        warnings.append(f"    [WARN] Error extracting {file_path.name}: {e}")
+        return None, warnings
+    finally:
+        if isinstance(content, mmap.mmap):
+            content.close()
+
+def extract_payload_fields(service: str, payload_class: str, event: EventSchema, event_file: Path,
+                           warnings: List[str]):
+    """Extract fields from the payload class"""
+    # Find payload file
+    payload_dir = event_file.parent / "payload"
+    payload_name = f"{payload_class}.java"
+    if payload_name not in _payload_files(payload_dir):
+        return
+    payload_path = payload_dir / payload_name
+
+    try:
+        content = payload_path.read_bytes().decode('utf-8')
+
+        # Look for record definition
+        record_match = _record_re(payload_class).search(content)
+        if not record_match:
+            # Try to find class definition with fields
+            return
+
+        # Parse fields from the record parameters: @Schema attributes apply to
+        # the next declaration
+        current_field = {}
+
+        for token in _RECORD_TOKEN_RE.finditer(content, record_match.end()):
+            kind = token.lastgroup
+            if kind == 'schema':
+                schema = token.group('schema')
+                schema_name_match = _SCHEMA_NAME_RE.search(schema)
+                if schema_name_match:
+                    current_field['name'] = schema_name_match.group(1)
+
+                schema_desc_match = _SCHEMA_DESC_RE.search(schema)
+                if schema_desc_match:
+                    current_field['description'] = schema_desc_match.group(1)
+
+                schema_example_match = _SCHEMA_EXAMPLE_RE.search(schema)
+                if schema_example_match:
+                    current_field['example'] = schema_example_match.group(1)
+
+                if _SCHEMA_REQUIRED_RE.search(schema):
+                    current_field['required'] = True
+
+            elif kind == 'name':
+                field_type = sys.intern(token.group('type'))
+                field_name = token.group('name')
+
+                # Create EventField
+                event_field = EventField(
+                    name=current_field.get('name', field_name),
+                    type=field_type,
+                    description=current_field.get('description', ''),
+                    required=current_field.get('required', False),
+                    example=current_field.get('example', '')
+                )
+                event.fields.append(event_field)
+                current_field = {}
+
+            elif kind == 'end':
+                break
+
+    except Exception as e:
+        warnings.append(f"      [WARN] Could not extract fields from {payload_class}: {e}")
+
 class BioproEventExtractor:
     """Extracts event schemas from BioPro manufacturing services"""
 
@@ -52,6 +266,25 @@ class BioproEventExtractor:
         self.events: List[EventSchema] = []
         self.stats = defaultdict(int)
 
+    @cached_property
+    def _service_dirs(self) -> Set[str]:
+        """Names present under the backend path, listed once"""
+        return set(_dir_names(self.backend_path) or ())
+
+    @cached_property
+    def _event_index(self) -> Tuple[Dict[str, List[EventSchema]], Dict[str, Set[str]]]:
+        """Events grouped by service and the services using each event type.
+
+        Built in one pass the first time the summary or report needs it, once
+        extraction has finished.
+        """
+        events_by_service = defaultdict(list)
+        service_by_type = defaultdict(set)
+        for event in self.events:
+            events_by_service[event.service].append(event)
+            service_by_type[event.event_type].add(event.service)
+        return events_by_service, service_by_type
+
     def extract_all(self):
         """Extract events from all services"""
         print("=" * 80)
@@ -61,39 +294,60 @@ class BioproEventExtractor:
         print(f"Services to analyze: {len(self.services)}")
         print()
 
+        # Files are independent, so list every service's event files up front
+        # and parse them all in one pool of worker processes
+        event_files = {service: self.find_event_files(service) for service in self.services}
+        tasks = [(service, event_file) for service, files in event_files.items() for event_file in files or ()]
+        with ProcessPoolExecutor(max_workers=os.cpu_count()) as pool:
+            results = pool.map(extract_event_from_file, [service for service, _ in tasks],
+                               [event_file for _, event_file in tasks], chunksize=32)
+            parsed = {event_file: result for (_, event_file), result in zip(tasks, results)}
+
         for service in self.services:
             print(f"\n{'=' * 80}")
             print(f"Analyzing Service: {service.upper()}")
             print('=' * 80)
-            self.extract_service_events(service)
+            self.extract_service_events(service, event_files[service], parsed)
 
         self.print_summary()
         self.save_results()
 
-    def extract_service_events(self, service: str):
-        """Extract all events from a specific service"""
+    def find_event_files(self, service: str) -> Optional[List[Path]]:
+        """Event definition files of a service, or None if it has no domain/event directory"""
+        if service not in self._service_dirs:
+            return None
+
+        # Find domain event directory; one listing answers both whether it
+        # exists and which event files it holds
+        domain_event_path = self.backend_path / service / "src/main/java/com/arcone/biopro/manufacturing" / service / "domain/event"
+        domain_event_names = _dir_names(domain_event_path)
+        if domain_event_names is None:
+            return None
+
+        # Find all event files (exclude base classes)
+        exclude_files = {'Event.java', 'EventKey.java', 'package-info.java'}
+        return [domain_event_path / name for name in domain_event_names
+                if name.endswith('Event.java') and name not in exclude_files]
+
+    def extract_service_events(self, service: str, event_files: Optional[List[Path]],
+                               parsed: Dict[Path, Tuple[Optional[EventSchema], List[str]]]):
+        """Record the parsed events of a specific service"""
         service_path = self.backend_path / service
-        if not service_path.exists():
+        if service not in self._service_dirs:
             print(f"  [ERROR] Service directory not found: {service_path}")
             return
 
-        # Find domain event directory
-        domain_event_path = service_path / "src/main/java/com/arcone/biopro/manufacturing" / service / "domain/event"
-
-        if not domain_event_path.exists():
+        if event_files is None:
             print(f"  [WARN] No domain/event directory found")
             self.stats[f'{service}_no_events'] += 1
             return
 
-        # Find all event files (exclude base classes)
-        event_files = list(domain_event_path.glob("*Event.java"))
-        exclude_files = {'Event.java', 'EventKey.java', 'package-info.java'}
-        event_files = [f for f in event_files if f.name not in exclude_files]
-
         print(f"  Found {len(event_files)} event definitions")
 
         for event_file in event_files:
-            event = self.extract_event_from_file(service, event_file)
+            event, warnings = parsed[event_file]
+            for warning in warnings:
+                print(warning)
             if event:
                 self.events.append(event)
                 print(f"    [OK] {event.event_name}")
@@ -102,136 +356,19 @@ class BioproEventExtractor:
         # Also check for events in other locations (infrastructure, adapter)
         self.check_additional_event_locations(service, service_path)
 
-    def extract_event_from_file(self, service: str, file_path: Path) -> EventSchema:
-        """Extract event schema from a Java file"""
-        try:
-            content = file_path.read_text(encoding='utf-8')
-
-            # Extract class name
-            class_match = re.search(r'public class (\w+Event)', content)
-            if not class_match:
-                return None
-            event_name = class_match.group(1)
-
-            # Extract event type from EventType enum reference
-            event_type_match = re.search(r'EventType\.(\w+)\(\)', content)
-            event_type = event_type_match.group(1) if event_type_match else event_name
-
-            # Extract version
-            version_match = re.search(r'EventVersion\.VERSION_(\d+_\d+)\(\)', content)
-            version = version_match.group(1).replace('_', '.') if version_match else "1.0"
-
-            # Extract payload class
-            payload_match = re.search(r'extends Event<(\w+)>', content)
-            payload_class = payload_match.group(1) if payload_match else "Unknown"
-
-            # Extract JavaDoc for purpose
-            javadoc_match = re.search(r'/\*\*(.*?)\*/', content, re.DOTALL)
-            purpose = ""
-            if javadoc_match:
-                javadoc = javadoc_match.group(1)
-                purpose = ' '.join(line.strip().lstrip('*').strip() for line in javadoc.split('\n') if line.strip())
-
-            event = EventSchema(
-                service=service,
-                event_name=event_name,
-                event_type=event_type,
-                version=version,
-                payload_class=payload_class,
-                purpose=purpose,
-                file_path=str(file_path)
-            )
-
-            # Try to extract payload fields
-            if payload_class != "Unknown":
-                self.extract_payload_fields(service, payload_class, event, file_path)
-
-            return event
-
-        except Exception as e:
-            print(f"    [WARN] Error extracting {file_path.name}: {e}")
-            return None
-
-    def extract_payload_fields(self, service: str, payload_class: str, event: EventSchema, event_file: Path):
-        """Extract fields from the payload class"""
-        # Find payload file
-        payload_path = event_file.parent / "payload" / f"{payload_class}.java"
-
-        if not payload_path.exists():
-            return
-
-        try:
-            content = payload_path.read_text(encoding='utf-8')
-
-            # Look for record definition
-            record_match = re.search(r'public record ' + payload_class + r'\s*\((.*?)\)', content, re.DOTALL)
-            if not record_match:
-                # Try to find class definition with fields
-                return
-
-            record_params = record_match.group(1)
-
-            # Parse fields from record parameters
-            # This is complex due to annotations, so we'll do a simpler extraction
-            lines = record_params.split('\n')
-            current_field = {}
-
-            for line in lines:
-                line = line.strip()
-
-                # Extract @Schema annotations
-                schema_name_match = re.search(r'name\s*=\s*"([^"]+)"', line)
-                if schema_name_match:
-                    current_field['name'] = schema_name_match.group(1)
-
-                schema_desc_match = re.search(r'description\s*=\s*"([^"]+)"', line)
-                if schema_desc_match:
-                    current_field['description'] = schema_desc_match.group(1)
-
-                schema_example_match = re.search(r'example\s*=\s*"([^"]+)"', line)
-                if schema_example_match:
-                    current_field['example'] = schema_example_match.group(1)
-
-                schema_required_match = re.search(r'requiredMode\s*=\s*REQUIRED', line)
-                if schema_required_match:
-                    current_field['required'] = True
-
-                # Check if this is the actual field declaration
-                # Format: Type fieldName
-                field_decl_match = re.search(r'^\s*([A-Z][\w<>,\s]+)\s+(\w+)\s*[,)]', line)
-                if field_decl_match:
-                    field_type = field_decl_match.group(1).strip()
-                    field_name = field_decl_match.group(2)
-
-                    # Create EventField
-                    event_field = EventField(
-                        name=current_field.get('name', field_name),
-                        type=field_type,
-                        description=current_field.get('description', ''),
-                        required=current_field.get('required', False),
-                        example=current_field.get('example', '')
-                    )
-                    event.fields.append(event_field)
-                    current_field = {}
-
-        except Exception as e:
-            print(f"      [WARN] Could not extract fields from {payload_class}: {e}")
-
     def check_additional_event_locations(self, service: str, service_path: Path):
         """Check for events in infrastructure and adapter packages"""
         # Check infrastructure/event
         infra_event_path = service_path / "src/main/java/com/arcone/biopro/manufacturing" / service / "infrastructure/event"
-        if infra_event_path.exists():
-            event_files = list(infra_event_path.glob("*Event.java"))
-            if event_files:
-                print(f"  Found {len(event_files)} additional events in infrastructure/event")
+        event_files = [name for name in _dir_names(infra_event_path) or () if name.endswith('Event.java')]
+        if event_files:
+            print(f"  Found {len(event_files)} additional events in infrastructure/event")
 
         # Check adapter/output/producer/event
         adapter_event_path = service_path / "src/main/java/com/arcone/biopro/manufacturing" / service / "adapter/output/producer/event"
-        if adapter_event_path.exists():
-            event_files = list(adapter_event_path.glob("*.java"))
-            if event_files:
-                print(f"  Found {len(event_files)} files in adapter/output/producer/event")
+        event_files = [name for name in _dir_names(adapter_event_path) or () if name.endswith('.java')]
+        if event_files:
+            print(f"  Found {len(event_files)} files in adapter/output/producer/event")
 
     def print_summary(self):
         """Print extraction summary"""
@@ -241,10 +378,7 @@ class BioproEventExtractor:
         print(f"\nTotal Events Extracted: {self.stats['total_events']}")
         print(f"Services Analyzed: {len(self.services)}")
 
-        # Group by service
-        events_by_service = defaultdict(list)
-        for event in self.events:
-            events_by_service[event.service].append(event)
+        events_by_service, service_by_type = self._event_index
 
         print(f"\nEvents per Service:")
         for service in sorted(events_by_service.keys()):
@@ -252,89 +386,101 @@ class BioproEventExtractor:
             print(f"  {service:25} {count:3} events")
 
         # Count unique event types
-        unique_types = set(event.event_type for event in self.events)
-        print(f"\nUnique Event Types: {len(unique_types)}")
+        print(f"\nUnique Event Types: {len(service_by_type)}")
 
     def save_results(self):
         """Save extraction results to files"""
         output_dir = Path("C:/Users/MelvinJones/work/event-governance/poc")
-
-        # Save as JSON
+        os.makedirs(output_dir, exist_ok=True)
         json_file = output_dir / "biopro-events-inventory.json"
-        with open(json_file, 'w', encoding='utf-8') as f:
-            json.dump([event.to_dict() for event in self.events], f, indent=2)
-        print(f"\n[OK] Saved JSON inventory to: {json_file}")
-
-        # Save as detailed markdown report
         md_file = output_dir / "BIOPRO-EVENTS-COMPREHENSIVE-INVENTORY.md"
-        self.generate_markdown_report(md_file)
-        print(f"[OK] Saved Markdown report to: {md_file}")
+
+        # The JSON inventory and the detailed markdown report are independent
+        # files, so write them concurrently
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            json_saved = pool.submit(self.save_json_inventory, json_file)
+            md_saved = pool.submit(self.generate_markdown_report, md_file)
+            json_saved.result()
+            print(f"\n[OK] Saved JSON inventory to: {json_file}")
+            md_saved.result()
+            print(f"[OK] Saved Markdown report to: {md_file}")
+
+    def save_json_inventory(self, json_file: Path):
+        """Save the extracted events as JSON"""
+        with open(json_file, 'wb') as f:
+            f.write(_dumps_indent(self.events))
 
     def generate_markdown_report(self, output_file: Path):
         """Generate comprehensive markdown report"""
-        events_by_service = defaultdict(list)
-        for event in self.events:
-            events_by_service[event.service].append(event)
+        events_by_service, service_by_type = self._event_index
+
+        # Accumulate the report and write it in one go
+        parts = []
+        write = parts.append
+        extend = parts.extend
+        write("# BioPro Manufacturing Services - Comprehensive Event Inventory\n\n")
+        write(f"**Generated:** {SCRIPT_NAME}\n\n")
+        write(f"**Total Events:** {len(self.events)}\n\n")
+        write(f"**Services Analyzed:** {len(self.services)}\n\n")
+
+        # Table of Contents
+        write("## Table of Contents\n\n")
+        for service in sorted(events_by_service.keys()):
+            count = len(events_by_service[service])
+            write(f"- [{service}](#{service}) ({count} events)\n")
+        write("\n---\n\n")
+
+        # Detailed service sections. Each event's and field's attributes are
+        # fetched once, in C, by a multi-attribute getter.
+        event_attrs = attrgetter('event_name', 'event_type', 'version', 'payload_class',
+                                 'purpose', 'file_path', 'fields')
+        field_attrs = attrgetter('name', 'type', 'required', 'description', 'example')
+        for service in sorted(events_by_service.keys()):
+            events = sorted(events_by_service[service], key=attrgetter('event_name'))
+
+            write(f"## {service}\n\n")
+            write(f"**Total Events:** {len(events)}\n\n")
+
+            for event in events:
+                name, event_type, version, payload_class, purpose, file_path, fields = event_attrs(event)
+                write(f"### {name}\n\n")
+                write(f"**Event Type:** `{event_type}`\n\n")
+                write(f"**Version:** {version}\n\n")
+                write(f"**Payload Class:** `{payload_class}`\n\n")
+
+                if purpose:
+                    write(f"**Purpose:** {purpose}\n\n")
+
+                write(f"**Schema Location:** `{file_path}`\n\n")
+
+                if fields:
+                    write("**Key Fields:**\n\n")
+                    write("| Field | Type | Required | Description |\n")
+                    write("|-------|------|----------|-------------|\n")
+                    extend([f"| {field_name} | {field_type} | {'Yes' if required else 'No'} | "
+                            f"{description or example or '-'} |\n"
+                            for field_name, field_type, required, description, example in map(field_attrs, fields)])
+                    write("\n")
+
+                write("---\n\n")
+
+        # Summary statistics
+        write("## Summary Statistics\n\n")
+        write("### Events by Service\n\n")
+        write("| Service | Event Count |\n")
+        write("|---------|-------------|\n")
+        for service in sorted(events_by_service.keys()):
+            count = len(events_by_service[service])
+            write(f"| {service} | {count} |\n")
+        write(f"| **TOTAL** | **{len(self.events)}** |\n\n")
+
+        # Event types
+        write("### All Event Types\n\n")
+        for et in sorted(service_by_type):
+            write(f"- `{et}` (used in: {', '.join(sorted(service_by_type[et]))})\n")
 
         with open(output_file, 'w', encoding='utf-8') as f:
-            f.write("# BioPro Manufacturing Services - Comprehensive Event Inventory\n\n")
-            f.write(f"**Generated:** {Path(__file__).name}\n\n")
-            f.write(f"**Total Events:** {len(self.events)}\n\n")
-            f.write(f"**Services Analyzed:** {len(self.services)}\n\n")
-
-            # Table of Contents
-            f.write("## Table of Contents\n\n")
-            for service in sorted(events_by_service.keys()):
-                count = len(events_by_service[service])
-                f.write(f"- [{service}](#{service}) ({count} events)\n")
-            f.write("\n---\n\n")
-
-            # Detailed service sections
-            for service in sorted(events_by_service.keys()):
-                events = sorted(events_by_service[service], key=lambda e: e.event_name)
-
-                f.write(f"## {service}\n\n")
-                f.write(f"**Total Events:** {len(events)}\n\n")
-
-                for event in events:
-                    f.write(f"### {event.event_name}\n\n")
-                    f.write(f"**Event Type:** `{event.event_type}`\n\n")
-                    f.write(f"**Version:** {event.version}\n\n")
-                    f.write(f"**Payload Class:** `{event.payload_class}`\n\n")
-
-                    if event.purpose:
-                        f.write(f"**Purpose:** {event.purpose}\n\n")
-
-                    f.write(f"**Schema Location:** `{event.file_path}`\n\n")
-
-                    if event.fields:
-                        f.write("**Key Fields:**\n\n")
-                        f.write("| Field | Type | Required | Description |\n")
-                        f.write("|-------|------|----------|-------------|\n")
-                        for field in event.fields:
-                            req = "Yes" if field.required else "No"
-                            desc = field.description or field.example or "-"
-                            f.write(f"| {field.name} | {field.type} | {req} | {desc} |\n")
-                        f.write("\n")
-
-                    f.write("---\n\n")
-
-            # Summary statistics
-            f.write("## Summary Statistics\n\n")
-            f.write("### Events by Service\n\n")
-            f.write("| Service | Event Count |\n")
-            f.write("|---------|-------------|\n")
-            for service in sorted(events_by_service.keys()):
-                count = len(events_by_service[service])
-                f.write(f"| {service} | {count} |\n")
-            f.write(f"| **TOTAL** | **{len(self.events)}** |\n\n")
-
-            # Event types
-            f.write("### All Event Types\n\n")
-            event_types = sorted(set(event.event_type for event in self.events))
-            for et in event_types:
-                services_with_event = [e.service for e in self.events if e.event_type == et]
-                f.write(f"- `{et}` (used in: {', '.join(set(services_with_event))})\n")
+            f.write(''.join(parts))
 
 def main():
     backend_path = "C:/Users/MelvinJones/work/biopro/biopro-manufacturing/backend"
@@ -11,11 +11,45 @@ Extracts events from:
 """
 
 import os
+import sys
 import json
 import re
+from concurrent.futures import ProcessPoolExecutor
+from itertools import groupby
+from operator import itemgetter
 from pathlib import Path
 from typing import List, Dict, Any
 
+try:
+    import orjson
+
+    def _dumps_indent(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+except ImportError:
+    def _dumps_indent(obj: Any) -> bytes:
+        return json.dumps(obj, indent=2).encode('utf-8')
+
+# Precompiled Java source patterns
+_PACKAGE_RE = re.compile(r'package\s+([\w.]+);')
+_CLASS_RE = re.compile(r'public\s+(?:record|class)\s+(\w+Event)')
+_EVENT_TYPE_RE = re.compile(r'EventType\.(\w+)')
+_RECORD_RE = re.compile(r'public\s+record\s+\w+Event\s*\((.*?)\)', re.DOTALL)
+_RECORD_PARAM_RE = re.compile(r'(\w+(?:<[\w<>, ]+>)?)\s+(\w+)')
+_PRIVATE_FIELD_RE = re.compile(r'private\s+(?:final\s+)?(\w+(?:<[\w<>, ]+>)?)\s+(\w+);')
+
+# Listeners are matched in two stages: the annotation body, method name and
+# parameter list first, then the topic and event type within those. Between the
+# listener annotation and the method, other annotations (arguments nested one
+# level deep, as in @RetryableTopic(backoff = @Backoff(...))) and line or block
+# comments are skipped. Every run is bounded by a delimiter, so there is no
+# nested backtracking.
+_KAFKA_LISTENER_RE = re.compile(
+    r'@KafkaListener\s*\(([^)]*)\)\s*'
+    r'(?:@[\w.]+(?:\s*\((?:[^()]|\([^()]*\))*\))?\s*|//[^\n]*\s*|/\*(?:[^*]|\*(?!/))*\*/\s*)*'
+    r'public\s+void\s+(\w+)\s*\(([^)]*)\)')
+_LISTENER_TOPIC_RE = re.compile(r'topics\s*=\s*\{?\s*["\']([^"\']+)["\']')
+_EVENT_PARAM_RE = re.compile(r'\b(\w+Event)\b')
+
 # Repository configurations
 REPOS = [
     {
@@ -41,12 +75,21 @@ REPOS = [
     }
 ]
 
+# Build output and tooling directories never worth descending into
+_SKIP_DIRS = {'target', 'build', '.git', '.gradle', 'node_modules'}
+
+def walk_sources(service_path: str):
+    """os.walk over a service, pruning build output and tooling directories"""
+    for root, dirs, files in os.walk(service_path):
+        dirs[:] = [d for d in dirs if d not in _SKIP_DIRS]
+        yield root, files
+
 def find_event_files(service_path: str) -> List[str]:
     """Find all event-related Java files"""
     event_files = []
 
     # Look for domain/event directories
-    for root, dirs, files in os.walk(service_path):
+    for root, files in walk_sources(service_path):
         if 'domain' in root and 'event' in root:
             for file in files:
                 if file.endswith('Event.java'):
@@ -58,7 +101,7 @@ def find_kafka_listeners(service_path: str) -> List[str]:
     """Find all Kafka listener files to identify consumers"""
     listener_files = []
 
-    for root, dirs, files in os.walk(service_path):
+    for root, files in walk_sources(service_path):
         if 'listener' in root.lower() or 'consumer' in root.lower():
             for file in files:
                 if file.endswith('.java'):
@@ -69,44 +112,48 @@ def find_kafka_listeners(service_path: str) -> List[str]:
 def extract_event_info(file_path: str) -> Dict[str, Any]:
     """Extract event information from Java file"""
     try:
-        with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-            content = f.read()
+        raw = Path(file_path).read_bytes()
+
+        # Files without an event record or class can't match; skip the decode and regexes
+        if b'Event' not in raw or (b'record' not in raw and b'class' not in raw):
+            return None
+        content = raw.decode('utf-8', errors='ignore')
 
         # Extract package
-        package_match = re.search(r'package\s+([\w.]+);', content)
-        package = package_match.group(1) if package_match else ""
+        package_match = _PACKAGE_RE.search(content)
+        package = sys.intern(package_match.group(1)) if package_match else ""
 
         # Extract class name
-        class_match = re.search(r'public\s+(?:record|class)\s+(\w+Event)', content)
+        class_match = _CLASS_RE.search(content)
         if not class_match:
             return None
         event_name = class_match.group(1)
 
         # Extract event type enum
-        type_match = re.search(r'EventType\.(\w+)', content)
-        event_type = type_match.group(1) if type_match else event_name.replace('Event', '').upper()
+        type_match = _EVENT_TYPE_RE.search(content)
+        event_type = sys.intern(type_match.group(1)) if type_match else event_name.replace('Event', '').upper()
 
-        # Extract fields from record or class
+        # Extract fields from record or class. Package, event type and field
+        # type names repeat across files; interned, each is stored once.
         fields = []
 
         # For records
-        record_match = re.search(r'public\s+record\s+\w+Event\s*\((.*?)\)', content, re.DOTALL)
+        record_match = _RECORD_RE.search(content)
         if record_match:
             params = record_match.group(1)
-            field_pattern = r'(\w+(?:<[\w<>, ]+>)?)\s+(\w+)'
-            for match in re.finditer(field_pattern, params):
+            for match in _RECORD_PARAM_RE.finditer(params):
                 fields.append({
                     "name": match.group(2),
-                    "type": match.group(1),
+                    "type": sys.intern(match.group(1)),
                     "required": True
                 })
 
         # For classes with fields
-        field_matches = re.finditer(r'private\s+(?:final\s+)?(\w+(?:<[\w<>, ]+>)?)\s+(\w+);', content)
+        field_matches = _PRIVATE_FIELD_RE.finditer(content)
         for match in field_matches:
             fields.append({
                 "name": match.group(2),
-                "type": match.group(1),
+                "type": sys.intern(match.group(1)),
                 "required": False
             })
 
@@ -125,18 +172,22 @@ def extract_event_info(file_path: str) -> Dict[str, Any]:
 def extract_kafka_consumers(file_path: str) -> List[Dict[str, str]]:
     """Extract Kafka consumer information"""
     try:
-        with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-            content = f.read()
+        raw = Path(file_path).read_bytes()
+        if b'@KafkaListener' not in raw:
+            return []
+        content = raw.decode('utf-8', errors='ignore')
 
         consumers = []
 
         # Find @KafkaListener annotations
-        listener_pattern = r'@KafkaListener\s*\([^)]+topics\s*=\s*["\']([^"\']+)["\'][^)]*\)[^{]*public\s+void\s+(\w+)\s*\([^)]*(\w+Event)'
-
-        for match in re.finditer(listener_pattern, content):
-            topic = match.group(1)
-            method = match.group(2)
-            event_type = match.group(3)
+        for match in _KAFKA_LISTENER_RE.finditer(content):
+            annotation, method, params = match.groups()
+            topic_match = _LISTENER_TOPIC_RE.search(annotation)
+            event_match = _EVENT_PARAM_RE.search(params)
+            if not topic_match or not event_match:
+                continue
+            topic = topic_match.group(1)
+            event_type = event_match.group(1)
 
             consumers.append({
                 "topic": topic,
@@ -159,6 +210,23 @@ def main():
     all_services = []
     event_flows = {}
 
+    # Files are independent, so walk every service up front and parse all
+    # event and listener files in one pool of worker processes
+    service_files = {}
+    for repo in REPOS:
+        for service_name in repo['services']:
+            service_path = os.path.join(repo['path'], service_name)
+            if os.path.exists(service_path):
+                service_files[service_path] = (find_event_files(service_path), find_kafka_listeners(service_path))
+
+    event_paths = [path for event_files, _ in service_files.values() for path in event_files]
+    listener_paths = [path for _, listener_files in service_files.values() for path in listener_files]
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as pool:
+        event_results = pool.map(extract_event_info, event_paths, chunksize=32)
+        listener_results = pool.map(extract_kafka_consumers, listener_paths, chunksize=32)
+        event_infos = dict(zip(event_paths, event_results))
+        listener_consumers = dict(zip(listener_paths, listener_results))
+
     for repo in REPOS:
         print(f"\n[REPO] Processing Repository: {repo['name']}")
         print(f"       Path: {repo['path']}")
@@ -167,24 +235,23 @@ def main():
         for service_name in repo['services']:
             service_path = os.path.join(repo['path'], service_name)
 
-            if not os.path.exists(service_path):
+            if service_path not in service_files:
                 print(f"       [WARNING] Service not found: {service_name}")
                 continue
 
             print(f"\n       [SERVICE] Analyzing Service: {service_name}")
+            event_files, listener_files = service_files[service_path]
 
             # Find events
-            event_files = find_event_files(service_path)
             print(f"      Found {len(event_files)} event files")
 
             # Find listeners
-            listener_files = find_kafka_listeners(service_path)
             print(f"      Found {len(listener_files)} listener files")
 
             # Extract event details
             service_events = []
             for event_file in event_files:
-                event_info = extract_event_info(event_file)
+                event_info = event_infos[event_file]
                 if event_info:
                     event_info['service'] = service_name
                     event_info['repository'] = repo['name']
@@ -194,8 +261,7 @@ def main():
             # Extract consumer information
             service_consumers = []
             for listener_file in listener_files:
-                consumers = extract_kafka_consumers(listener_file)
-                service_consumers.extend(consumers)
+                service_consumers.extend(listener_consumers[listener_file])
 
             # Build service record
             service_record = {
@@ -215,23 +281,29 @@ def main():
             for event in service_events:
                 if event['name'] not in event_flows:
                     event_flows[event['name']] = {
-                        "publishers": [],
-                        "consumers": []
+                        "publishers": set(),
+                        "consumers": set()
                     }
-                event_flows[event['name']]['publishers'].append(service_name)
+                event_flows[event['name']]['publishers'].add(service_name)
 
             for consumer in service_consumers:
                 event_name = consumer['event']
                 if event_name not in event_flows:
                     event_flows[event_name] = {
-                        "publishers": [],
-                        "consumers": []
+                        "publishers": set(),
+                        "consumers": set()
                     }
-                event_flows[event_name]['consumers'].append(service_name)
+                event_flows[event_name]['consumers'].add(service_name)
 
             print(f"       [OK] Published: {len(service_events)} events")
             print(f"       [OK] Consumes: {len(service_consumers)} events")
 
+    # Flows are accumulated as sets; store them as sorted lists for JSON
+    event_flows = {
+        event_name: {"publishers": sorted(flow["publishers"]), "consumers": sorted(flow["consumers"])}
+        for event_name, flow in event_flows.items()
+    }
+
     # Generate summary
     print("\n" + "="*80)
     print("EXTRACTION SUMMARY")
@@ -255,8 +327,8 @@ def main():
     }
 
     output_file = "biopro-complete-inventory.json"
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump(output, f, indent=2)
+    with open(output_file, 'wb') as f:
+        f.write(_dumps_indent(output))
 
     print(f"\n[OK] Complete inventory saved to: {output_file}")
 
@@ -268,7 +340,10 @@ def main():
 def generate_markdown_report(services, events, event_flows):
     """Generate human-readable markdown report"""
 
-    report = f"""# BioPro Complete Event Analysis Report
+    # Accumulate the report and write it in one go
+    parts = []
+    write = parts.append
+    write(f"""# BioPro Complete Event Analysis Report
 
 ## Executive Summary
 
@@ -278,43 +353,37 @@ def generate_markdown_report(services, events, event_flows):
 
 ## Services by Repository
 
-"""
+""")
 
-    # Group by repository
-    repos = {}
-    for service in services:
-        repo = service['repository']
-        if repo not in repos:
-            repos[repo] = []
-        repos[repo].append(service)
-
-    for repo_name, repo_services in sorted(repos.items()):
-        report += f"### {repo_name}\n\n"
-        report += f"| Service | Published | Consumed |\n"
-        report += f"|---------|-----------|----------|\n"
+    # Group by repository; the sort is stable, so services keep their configured order
+    by_repository = itemgetter('repository')
+    for repo_name, repo_services in groupby(sorted(services, key=by_repository), key=by_repository):
+        write(f"### {repo_name}\n\n")
+        write(f"| Service | Published | Consumed |\n")
+        write(f"|---------|-----------|----------|\n")
         for svc in repo_services:
-            report += f"| {svc['name']} | {svc['events_published']} | {svc['events_consumed']} |\n"
-        report += "\n"
+            write(f"| {svc['name']} | {svc['events_published']} | {svc['events_consumed']} |\n")
+        write("\n")
 
-    report += "## Event Flows\n\n"
-    report += "### Complete Event Choreography\n\n"
+    write("## Event Flows\n\n")
+    write("### Complete Event Choreography\n\n")
 
     for event_name, flow in sorted(event_flows.items()):
         publishers = flow['publishers'] or ['Unknown']
         consumers = flow['consumers'] or ['None']
-        report += f"**{event_name}**\n"
-        report += f"- Publishers: {', '.join(publishers)}\n"
-        report += f"- Consumers: {', '.join(consumers)}\n\n"
+        write(f"**{event_name}**\n")
+        write(f"- Publishers: {', '.join(publishers)}\n")
+        write(f"- Consumers: {', '.join(consumers)}\n\n")
 
-    report += "## All Events\n\n"
-    report += "| Event Name | Service | Repository | Fields |\n"
-    report += "|------------|---------|------------|--------|\n"
+    write("## All Events\n\n")
+    write("| Event Name | Service | Repository | Fields |\n")
+    write("|------------|---------|------------|--------|\n")
 
-    for event in sorted(events, key=lambda x: x['name']):
-        report += f"| {event['name']} | {event['service']} | {event['repository']} | {len(event['fields'])} |\n"
+    for event in sorted(events, key=itemgetter('name')):
+        write(f"| {event['name']} | {event['service']} | {event['repository']} | {len(event['fields'])} |\n")
 
     with open('BIOPRO-COMPLETE-ANALYSIS.md', 'w', encoding='utf-8') as f:
-        f.write(report)
+        f.write(''.join(parts))
 
     print(f"[OK] Analysis report saved to: BIOPRO-COMPLETE-ANALYSIS.md")
 
@@ -13,11 +13,52 @@ Usage:
 
 import os
 import re
+import sys
 import json
 import argparse
+import traceback
 from pathlib import Path
-from typing import Dict, List, Tuple, Optional, Set
+from typing import Any, Dict, Iterator, List, Tuple, Optional, Set
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
+from functools import lru_cache
+from itertools import repeat
+
+try:
+    import orjson  # Optional: faster serializer for the .avsc files
+
+    def _dumps_indent(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+except ImportError:
+    def _dumps_indent(obj: Any) -> bytes:
+        return json.dumps(obj, indent=2).encode('utf-8')
+
+# Precompiled Java source patterns. Sources are scanned as raw bytes since
+# every token of interest is ASCII; only the small captured groups get decoded.
+_PACKAGE_RE = re.compile(rb'package\s+([\w.]+);')
+_RECORD_NAME_RE = re.compile(rb'public\s+record\s+(\w+)\s*\(')
+_RECORD_DOC_RE = re.compile(rb'@Schema\([^)]*description\s*=\s*"([^"]+)"')
+_RECORD_DEF_RE = re.compile(rb'public\s+record\s+\w+\s*\((.*?)\)\s*implements', re.DOTALL)
+
+# Patterns over the decoded record components
+# Annotation arguments up to the closing parenthesis, when no parenthesis is
+# nested outside a string literal (the common case, matched in one call)
+_FLAT_ARGS_RE = re.compile(r'[^()"]*(?:"[^"\\]*(?:\\.[^"\\]*)*"[^()"]*)*\)')
+# Tokens inside annotation arguments: string literals (skipped whole) and parentheses
+_ARGS_TOKEN_RE = re.compile(r'"[^"\\]*(?:\\.[^"\\]*)*"|[()]')
+# What follows a component's @Schema(...): any other annotations, its type and name
+_TYPE_NAME_RE = re.compile(r'\s*(?:@[\w.]+(?:\([^)]*\))?\s*)*(\w+(?:<[^>]+>)?)\s+(\w+)\s*(?:,|$)')
+_CONTAINER_RE = re.compile(r'(\w+)<(.+)>')
+
+# @Schema annotation attributes
+_DESCRIPTION_RE = re.compile(r'description\s*=\s*"([^"]+)"')
+_TITLE_RE = re.compile(r'title\s*=\s*"([^"]+)"')
+_EXAMPLE_RE = re.compile(r'example\s*=\s*"([^"]+)"')
+
+# Value objects: enum-like constants and the components of simple records
+_ENUM_CONST_RE = re.compile(rb'private\s+static\s+final\s+String\s+(\w+)\s*=\s*"([^"]+)"')
+_SIMPLE_RECORD_RE = re.compile(rb'public\s+record\s+(\w+)\s*\(([^)]+)\)')
+_PARAM_RE = re.compile(r'(\w+(?:<[^>]+>)?)\s+(\w+)')
 
 # ANSI color codes
 class Colors:
@@ -28,7 +69,7 @@ class Colors:
     NC = '\033[0m'
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class JavaField:
     name: str
     java_type: str
@@ -37,7 +78,7 @@ class JavaField:
     example: Optional[str]
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class JavaRecord:
     name: str
     namespace: str
@@ -45,47 +86,69 @@ class JavaRecord:
     fields: List[JavaField]
 
 
+@dataclass
+class PayloadResult:
+    """Outcome of processing one payload file in a worker process"""
+    record: Optional[JavaRecord] = None
+    file_name: Optional[str] = None
+    schema_json: Optional[bytes] = None
+    type_count: int = 0
+    error: Optional[str] = None
+    trace: Optional[str] = None
+
+
 # Global cache for resolved types
 type_definitions_cache: Dict[str, dict] = {}
 
+# Types with no usable definition in the source tree; unlike the resolved
+# types these hold for the whole run
+unresolved_types: Set[str] = set()
+
+
+@lru_cache(maxsize=None)
+def _read_file(file_path: Path) -> bytes:
+    """Raw source of a Java file, read once however often its type is resolved"""
+    return file_path.read_bytes()
+
+
+def _text(token: bytes) -> str:
+    """Decode a captured source token"""
+    return token.decode('utf-8', 'ignore')
+
 
 def is_value_object_enum(file_path: Path) -> Tuple[bool, List[str]]:
     """Check if a Java record is an enum-like value object and extract symbols"""
-    with open(file_path, 'r', encoding='utf-8') as f:
-        content = f.read()
+    content = _read_file(file_path)
 
     # Pattern: record(String value) with static final String constants
-    if 'record' in content and '(String value)' in content:
+    if b'record' in content and b'(String value)' in content:
         # Extract static constants
-        constants = re.findall(r'private\s+static\s+final\s+String\s+(\w+)\s*=\s*"([^"]+)"', content)
+        constants = _ENUM_CONST_RE.findall(content)
         if constants:
-            return True, [const[1] for const in constants]
+            return True, [_text(const[1]) for const in constants]
 
     return False, []
 
 
 def parse_simple_record(file_path: Path, source_dir: Path) -> Optional[dict]:
     """Parse a simple Java record and return Avro record definition"""
-    with open(file_path, 'r', encoding='utf-8') as f:
-        content = f.read()
+    content = _read_file(file_path)
 
     # Extract record name
-    record_match = re.search(r'public\s+record\s+(\w+)\s*\(([^)]+)\)', content)
+    record_match = _SIMPLE_RECORD_RE.search(content)
     if not record_match:
         return None
 
-    record_name = record_match.group(1)
-    params = record_match.group(2)
+    record_name = _text(record_match.group(1))
+    params = _text(record_match.group(2))
 
     # Extract namespace
-    namespace_match = re.search(r'package\s+([\w.]+);', content)
-    namespace = namespace_match.group(1) if namespace_match else ""
+    namespace_match = _PACKAGE_RE.search(content)
+    namespace = _text(namespace_match.group(1)) if namespace_match else ""
 
     # Parse record parameters (simple version)
     fields = []
-    param_pattern = r'(\w+(?:<[^>]+>)?)\s+(\w+)'
-
-    for match in re.finditer(param_pattern, params):
+    for match in _PARAM_RE.finditer(params):
         field_type = match.group(1).strip()
         field_name = match.group(2).strip()
 
@@ -106,21 +169,73 @@ def parse_simple_record(file_path: Path, source_dir: Path) -> Optional[dict]:
     }
 
 
-def find_type_file(type_name: str, source_dir: Path) -> Optional[Path]:
-    """Find the Java file for a custom type"""
-    # Search in valueobject and payload directories
-    patterns = [
-        f"**/valueobject/{type_name}.java",
-        f"**/payload/{type_name}.java",
-        f"**/{type_name}.java"
-    ]
+# Where a type definition is looked for first: valueobject, then payload
+# directories, then anywhere else in the tree
+_TYPE_DIR_RANKS = {'valueobject': 0, 'payload': 1}
+
+# Event classes sit directly in a domain/event directory, their payloads in
+# domain/event/payload (both relative to the source root)
+_EVENT_DIR = os.sep + os.path.join('domain', 'event')
+_PAYLOAD_DIR = os.sep + os.path.join('domain', 'event', 'payload')
 
-    for pattern in patterns:
-        matches = list(source_dir.glob(pattern))
-        if matches:
-            return matches[0]
+# Type indexes by source tree; worker processes are handed the parent's
+# instead of walking the tree again
+_type_indexes: Dict[Path, Dict[str, str]] = {}
 
-    return None
+
+def _discover(root: str) -> Tuple[List[str], List[Path], Dict[str, str]]:
+    """Find event classes, payload classes and type definitions in one tree walk
+
+    Returns the event class paths, the payload class files and an index of
+    every Java type name to the path that defines it.
+    """
+    event_files = []
+    payload_files = []
+    type_index = {}
+    ranks = {}
+    root_len = len(root)
+
+    for dir_path, _, file_names in os.walk(root):
+        rel_dir = os.sep + dir_path[root_len:].lstrip(os.sep)
+        is_event_dir = rel_dir.endswith(_EVENT_DIR)
+        is_payload_dir = rel_dir.endswith(_PAYLOAD_DIR)
+        rank = _TYPE_DIR_RANKS.get(os.path.basename(rel_dir), 2)
+
+        for file_name in file_names:
+            if not file_name.endswith('.java'):
+                continue
+            file_path = os.path.join(dir_path, file_name)
+            if is_event_dir and file_name.endswith('Event.java'):
+                event_files.append(file_path)
+            elif is_payload_dir:
+                payload_files.append(Path(file_path))
+
+            # Keep the first file in walk order at the best directory rank
+            type_name = file_name[:-5]
+            if rank < ranks.get(type_name, 3):
+                ranks[type_name] = rank
+                type_index[type_name] = file_path
+
+    return event_files, payload_files, type_index
+
+
+def _type_index(source_dir: Path) -> Dict[str, str]:
+    """The type index of source_dir, built on first use"""
+    index = _type_indexes.get(source_dir)
+    if index is None:
+        index = _type_indexes[source_dir] = _discover(str(source_dir))[2]
+    return index
+
+
+def _init_worker(source_dir: Path, type_index: Dict[str, str]):
+    """Worker process initializer: adopt the parent's type index"""
+    _type_indexes[source_dir] = type_index
+
+
+def find_type_file(type_name: str, source_dir: Path) -> Optional[Path]:
+    """Find the Java file for a custom type"""
+    file_path = _type_index(source_dir).get(type_name)
+    return Path(file_path) if file_path else None
 
 
 def resolve_java_type_to_avro(java_type: str, source_dir: Path, processed: Set[str]) -> any:
@@ -128,7 +243,7 @@ def resolve_java_type_to_avro(java_type: str, source_dir: Path, processed: Set[s
 
     # Handle generic types
     if '<' in java_type:
-        container_match = re.match(r'(\w+)<(.+)>', java_type)
+        container_match = _CONTAINER_RE.match(java_type)
         if container_match:
             container = container_match.group(1)
             element_type = container_match.group(2)
@@ -163,7 +278,7 @@ def resolve_java_type_to_avro(java_type: str, source_dir: Path, processed: Set[s
         return type_definitions_cache[java_type]
 
     # Avoid infinite recursion
-    if java_type in processed:
+    if java_type in processed or java_type in unresolved_types:
         return "string"  # Fallback
 
     processed.add(java_type)
@@ -189,6 +304,7 @@ def resolve_java_type_to_avro(java_type: str, source_dir: Path, processed: Set[s
             return record_def
 
     # Fallback: treat as string
+    unresolved_types.add(java_type)
     return "string"
 
 
@@ -204,54 +320,87 @@ def java_type_to_avro_with_resolution(java_type: str, required: bool, source_dir
     return avro_type
 
 
+def _iter_fields(record_components: str) -> Iterator[Tuple[str, str, str]]:
+    """Yield (schema attributes, type, name) for each @Schema-annotated record component
+
+    Walks the component list once: every @Schema( is matched to its closing
+    parenthesis by depth, ignoring string literals, and the type and name are
+    read straight after it.
+    """
+    pos = record_components.find('@Schema(')
+    while pos != -1:
+        start = pos + len('@Schema(')
+        flat_args = _FLAT_ARGS_RE.match(record_components, start)
+        if flat_args:
+            close = flat_args.end() - 1
+        else:
+            depth = 1
+            for token in _ARGS_TOKEN_RE.finditer(record_components, start):
+                char = token.group()
+                if char == '(':
+                    depth += 1
+                elif char == ')':
+                    depth -= 1
+                    if depth == 0:
+                        break
+            else:
+                return  # Unterminated annotation
+            close = token.start()
+
+        match = _TYPE_NAME_RE.match(record_components, close + 1)
+        if match:
+            yield record_components[start:close], match.group(1), match.group(2)
+            pos = record_components.find('@Schema(', match.end())
+        else:
+            pos = record_components.find('@Schema(', close + 1)
+
+
 def parse_java_record(file_path: Path, source_dir: Path) -> Optional[JavaRecord]:
     """Parse a Java record class and extract field information"""
 
-    with open(file_path, 'r', encoding='utf-8') as f:
-        content = f.read()
+    content = _read_file(file_path)
+
+    # Cheap literal check before any pattern runs
+    if b'record' not in content:
+        return None
 
     # Extract package/namespace
-    namespace_match = re.search(r'package\s+([\w.]+);', content)
-    namespace = namespace_match.group(1) if namespace_match else "com.biopro.events"
+    namespace_match = _PACKAGE_RE.search(content)
+    namespace = _text(namespace_match.group(1)) if namespace_match else "com.biopro.events"
 
     # Extract record name
-    record_match = re.search(r'public\s+record\s+(\w+)\s*\(', content)
+    record_match = _RECORD_NAME_RE.search(content)
     if not record_match:
         return None
-    record_name = record_match.group(1)
+    record_name = _text(record_match.group(1))
 
     # Extract @Schema annotation for doc
-    schema_doc_match = re.search(r'@Schema\([^)]*description\s*=\s*"([^"]+)"', content)
-    doc = schema_doc_match.group(1) if schema_doc_match else f"Payload for {record_name} event"
+    schema_doc_match = _RECORD_DOC_RE.search(content)
+    doc = _text(schema_doc_match.group(1)) if schema_doc_match else f"Payload for {record_name} event"
 
     # Extract fields from record components
     fields = []
 
-    # Find the record definition (between parentheses)
-    record_def_match = re.search(r'public\s+record\s+\w+\s*\((.*?)\)\s*implements', content, re.DOTALL)
+    # Find the record definition (between parentheses), resuming from the
+    # record header rather than rescanning the package and imports
+    record_def_match = _RECORD_DEF_RE.search(content, record_match.start())
     if not record_def_match:
         return None
 
-    record_components = record_def_match.group(1)
-
-    # Split by field (look for @Schema annotations followed by type and name)
-    field_pattern = r'@Schema\((.*?)\)\s*(\w+(?:<[^>]+>)?)\s+(\w+)(?:,|\s*$)'
-
-    for match in re.finditer(field_pattern, record_components, re.DOTALL):
-        schema_attrs = match.group(1)
-        field_type = match.group(2)
-        field_name = match.group(3)
+    record_components = _text(record_def_match.group(1))
 
+    # Walk the @Schema-annotated components: attributes, type and name
+    for schema_attrs, field_type, field_name in _iter_fields(record_components):
         # Extract field attributes
         required = 'requiredMode = REQUIRED' in schema_attrs or 'requiredMode = Schema.RequiredMode.REQUIRED' in schema_attrs
 
         # Extract documentation
-        doc_match = re.search(r'description\s*=\s*"([^"]+)"', schema_attrs)
-        title_match = re.search(r'title\s*=\s*"([^"]+)"', schema_attrs)
+        doc_match = _DESCRIPTION_RE.search(schema_attrs)
+        title_match = _TITLE_RE.search(schema_attrs)
         field_doc = doc_match.group(1) if doc_match else (title_match.group(1) if title_match else "")
 
         # Extract example
-        example_match = re.search(r'example\s*=\s*"([^"]+)"', schema_attrs)
+        example_match = _EXAMPLE_RE.search(schema_attrs)
         example = example_match.group(1) if example_match else None
 
         fields.append(JavaField(
@@ -305,52 +454,97 @@ def generate_avro_schema(record: JavaRecord, source_dir: Path) -> dict:
     return schema
 
 
+# Envelope fields shared by every event schema, ahead of the payload; the
+# eventType default is filled in per event
+_ENVELOPE_TEMPLATE = (
+    {
+        "name": "eventId",
+        "type": {"type": "string", "logicalType": "uuid"},
+        "doc": "Unique identifier for this event"
+    },
+    {
+        "name": "occurredOn",
+        "type": {"type": "long", "logicalType": "timestamp-millis"},
+        "doc": "Timestamp when event occurred"
+    },
+    {
+        "name": "occurredOnTimeZone",
+        "type": "string",
+        "default": "UTC",
+        "doc": "Timezone for occurredOn"
+    },
+    {
+        "name": "eventType",
+        "type": "string",
+        "default": None,
+        "doc": "Type of event"
+    },
+    {
+        "name": "eventVersion",
+        "type": "string",
+        "default": "1.0",
+        "doc": "Version of the event schema"
+    },
+)
+
+
 def generate_event_envelope_schema(event_type: str, payload_schema: dict, namespace: str) -> dict:
     """Generate complete event schema with envelope"""
 
+    # Shallow copies: the nested logical-type dicts are only ever read
+    fields = [field.copy() for field in _ENVELOPE_TEMPLATE]
+    fields[3]["default"] = event_type.replace("Event", "")
+    fields.append({
+        "name": "payload",
+        "type": payload_schema,
+        "doc": f"{event_type} payload"
+    })
+
     return {
         "type": "record",
         "name": event_type,
         "namespace": namespace,
         "doc": f"Event published when {event_type.replace('Event', '').lower()} occurs",
-        "fields": [
-            {
-                "name": "eventId",
-                "type": {"type": "string", "logicalType": "uuid"},
-                "doc": "Unique identifier for this event"
-            },
-            {
-                "name": "occurredOn",
-                "type": {"type": "long", "logicalType": "timestamp-millis"},
-                "doc": "Timestamp when event occurred"
-            },
-            {
-                "name": "occurredOnTimeZone",
-                "type": "string",
-                "default": "UTC",
-                "doc": "Timezone for occurredOn"
-            },
-            {
-                "name": "eventType",
-                "type": "string",
-                "default": event_type.replace("Event", ""),
-                "doc": "Type of event"
-            },
-            {
-                "name": "eventVersion",
-                "type": "string",
-                "default": "1.0",
-                "doc": "Version of the event schema"
-            },
-            {
-                "name": "payload",
-                "type": payload_schema,
-                "doc": f"{event_type} payload"
-            }
-        ]
+        "fields": fields
     }
 
 
+def _process_payload(payload_file: Path, source_dir: Path) -> PayloadResult:
+    """Parse one payload record and build its event schema
+
+    Runs in a worker process, so nothing is printed or written here: the
+    record, the serialized schema, the number of nested types it resolved and any
+    error go back to extract_schemas, which reports them in payload order.
+    """
+    result = PayloadResult()
+    try:
+        result.record = record = parse_java_record(payload_file, source_dir)
+        if not record:
+            return result
+
+        # Generate payload schema WITH nested type resolution
+        payload_schema = generate_avro_schema(record, source_dir)
+
+        # Infer event type name from payload
+        event_type = f"Apheresis Plasma{record.name.replace('Product', 'Product ')}Event"
+
+        # Generate full event schema with envelope
+        event_schema = generate_event_envelope_schema(
+            event_type.replace(" ", ""),
+            payload_schema,
+            record.namespace.replace(".payload", "")
+        )
+
+        result.file_name = f"{event_type.replace(' ', '')}.avsc"
+        result.schema_json = _dumps_indent(event_schema)
+        result.type_count = len(type_definitions_cache)
+
+    except Exception as e:
+        result.error, result.trace = str(e), traceback.format_exc()
+
+    return result
+
+
 def extract_schemas(source_dir: Path, output_dir: Path):
     """Extract all event schemas from Java source code"""
 
@@ -364,8 +558,8 @@ def extract_schemas(source_dir: Path, output_dir: Path):
 
     # Find all Event classes
     print(f"{Colors.BLUE}[1/3] Scanning for Event classes...{Colors.NC}")
-    event_files = list(source_dir.glob("**/domain/event/*Event.java"))
-    payload_files = list(source_dir.glob("**/domain/event/payload/*.java"))
+    event_files, payload_files, type_index = _discover(str(source_dir))
+    _type_indexes[source_dir] = type_index
 
     print(f"{Colors.GREEN}Found {len(event_files)} event classes{Colors.NC}")
     print(f"{Colors.GREEN}Found {len(payload_files)} payload classes{Colors.NC}\n")
@@ -376,46 +570,39 @@ def extract_schemas(source_dir: Path, output_dir: Path):
     schemas_generated = 0
     schemas_failed = 0
 
-    for payload_file in payload_files:
-        print(f"{Colors.YELLOW}Processing:{Colors.NC} {payload_file.name}")
+    with ProcessPoolExecutor(max_workers=os.cpu_count(), initializer=_init_worker,
+                             initargs=(source_dir, type_index)) as pool:
+        results = pool.map(_process_payload, payload_files, repeat(source_dir), chunksize=8)
 
-        try:
-            record = parse_java_record(payload_file, source_dir)
-            if not record:
+        for payload_file, result in zip(payload_files, results):
+            print(f"{Colors.YELLOW}Processing:{Colors.NC} {payload_file.name}")
+
+            record = result.record
+            if record:
+                print(f"  Record: {record.name}")
+                print(f"  Fields: {len(record.fields)}")
+            elif not result.error:
                 print(f"  {Colors.YELLOW}Skipped (not a record class){Colors.NC}\n")
                 continue
 
-            print(f"  Record: {record.name}")
-            print(f"  Fields: {len(record.fields)}")
-
-            # Generate payload schema WITH nested type resolution
-            payload_schema = generate_avro_schema(record, source_dir)
-
-            # Infer event type name from payload
-            event_type = f"Apheresis Plasma{record.name.replace('Product', 'Product ')}Event"
-
-            # Generate full event schema with envelope
-            event_schema = generate_event_envelope_schema(
-                event_type.replace(" ", ""),
-                payload_schema,
-                record.namespace.replace(".payload", "")
-            )
-
-            # Write schema file
-            output_file = output_dir / f"{event_type.replace(' ', '')}.avsc"
-            with open(output_file, 'w', encoding='utf-8') as f:
-                json.dump(event_schema, f, indent=2)
+            if not result.error:
+                # Write schema file
+                output_file = output_dir / result.file_name
+                try:
+                    output_file.write_bytes(result.schema_json)
+                except Exception as e:
+                    result.error, result.trace = str(e), traceback.format_exc()
+
+            if result.error:
+                print(f"  {Colors.RED}Error:{Colors.NC} {result.error}\n")
+                sys.stderr.write(result.trace)
+                schemas_failed += 1
+                continue
 
             print(f"  {Colors.GREEN}Generated:{Colors.NC} {output_file.name}")
-            print(f"  Resolved nested types: {len(type_definitions_cache)}\n")
+            print(f"  Resolved nested types: {result.type_count}\n")
             schemas_generated += 1
 
-        except Exception as e:
-            print(f"  {Colors.RED}Error:{Colors.NC} {e}\n")
-            import traceback
-            traceback.print_exc()
-            schemas_failed += 1
-
     # Summary
     print(f"{Colors.BLUE}{'='*70}{Colors.NC}")
     print(f"{Colors.GREEN}Schema extraction complete!{Colors.NC}")